@@ -34,15 +34,17 @@ def _():
         FILES = {
             "data.py": f"{BASE}/data.py",
             "forecast.py": f"{BASE}/forecast.py",
+            "plotting.py": f"{BASE}/plotting.py",
+            "kernels.py": f"{BASE}/kernels.py",
             "slides.py": f"{BASE}/slides.py",
             "inventory.py": f"{BASE}/inventory.py",
+            "sweep.py": f"{BASE}/sweep.py",
         }
         PACKAGES = [
             "pandas",
             "altair",
             "scikit-learn",
             "numpy",
-            "statsmodels",
             "scipy",
             "typing_extensions",
             "utilsforecast"
@@ -118,9 +120,10 @@ def _(utils_manager):
                                HoltDoubleExpPlotter, HoltWintersPlotter,
                                TimeSeriesDecompositionPlotter)
     from utils.slides import SlideCreator
+    from utils.sweep import SmoothingSweep
 
 
-    return (SlideCreator, DataLoader, DataSplitter, ForecastLoader, Evaluator, ForecastPlotter, HoltDoubleExpPlotter, HoltWintersPlotter, TimeSeriesDecompositionPlotter, np, pd, Bunch, mo)
+    return (SlideCreator, DataLoader, DataSplitter, ForecastLoader, Evaluator, ForecastPlotter, HoltDoubleExpPlotter, HoltWintersPlotter, TimeSeriesDecompositionPlotter, SmoothingSweep, np, pd, Bunch, mo)
 
 
 
@@ -231,7 +234,7 @@ def _(data_daily):
     data = (
         data_daily
         .set_index('date')  # Set 'ds' as index
-        .groupby('unique_id')  # Group by time series
+        .groupby('unique_id', observed=True)  # Group by time series
         .resample('W-MON')  # Resample now that 'ds' is the index
         .agg({'demand': 'sum'})  # Aggregation method
         .reset_index()  # Return to flat format
@@ -252,7 +255,7 @@ def _(data, mo, sc):
         history_weekly = (
             history_daily
             .set_index('date')  # Set 'ds' as index
-            .groupby('unique_id')  # Group by time series
+            .groupby('unique_id', observed=True)  # Group by time series
             .resample('W-MON')  # Resample now that 'ds' is the index
             .agg({'demand': 'sum'})  # Aggregation method
             .reset_index()  # Return to flat format
@@ -362,6 +365,7 @@ def _(
     ForecastLoader,
     MA_CONFIG,
     SES_CONFIG,
+    SmoothingSweep,
     data,
     fc_plotter,
     history,
@@ -397,6 +401,14 @@ def _(
     fc_loader = ForecastLoader()
     forecast, historic_forecast = fc_loader.load_data(DataURLs.FORECAST, DataURLs.HISTORIC_FORECAST)
 
+    # MA / SES columns are recomputed for the configured slider grid on the stored cutoffs
+    sweep = SmoothingSweep()
+    sweep_params = dict(
+        ma_windows=ma_qs, ses_alphas=ses_alphas, ma_aliases=ma_names, ses_aliases=ses_names
+    )
+    forecast = sweep.update_forecast(forecast, data, **sweep_params)
+    historic_forecast = sweep.update_forecast(historic_forecast, data, **sweep_params)
+
     mo.ui.dataframe(
         forecast,
     )
@@ -1602,8 +1614,17 @@ def _(hw_theory2):
 
 
 @app.cell(hide_code=True)
-def _(HoltWintersPlotter):
+def _(HoltWintersPlotter, historic_forecast, np):
     holt_winters_plotter = HoltWintersPlotter()
+
+    # Precompute every slider combination once; slider moves only select a row
+    hw_values = np.round(np.arange(0.1, 1.01, 0.1), 1)
+    hw_alpha, hw_beta, hw_gamma = (
+        v.ravel() for v in np.meshgrid(hw_values, hw_values, hw_values, indexing="ij")
+    )
+    holt_winters_plotter.fit_grid(
+        df=historic_forecast, seasonal_periods=52, alpha=hw_alpha, beta=hw_beta, gamma=hw_gamma
+    )
     return (holt_winters_plotter,)
 
 
@@ -1627,7 +1648,6 @@ def _(
     alpha_slider_triple,
     beta_slider_triple,
     gamma_slider_triple,
-    historic_forecast,
     holt_winters_plotter,
     mo,
     sc,
@@ -1639,7 +1659,7 @@ def _(
     # Add sliders for alpha and beta
     holt_winters_visualization.content1 = mo.vstack([alpha_slider_triple, beta_slider_triple, gamma_slider_triple])
 
-    holt_winters_plotter.fit(df=historic_forecast, alpha=alpha_slider_triple.value, beta=beta_slider_triple.value, gamma=gamma_slider_triple.value, seasonal_periods=52)
+    holt_winters_plotter.select(alpha=alpha_slider_triple.value, beta=beta_slider_triple.value, gamma=gamma_slider_triple.value)
 
     holt_winters_plot = holt_winters_plotter.plot()
 
@@ -33,6 +33,8 @@ def _():
         FILES = {
             "data.py": f"{BASE}/data.py",
             "forecast.py": f"{BASE}/forecast.py",
+            "plotting.py": f"{BASE}/plotting.py",
+            "kernels.py": f"{BASE}/kernels.py",
             "slides.py": f"{BASE}/slides.py",
             "mrp.py": f"{BASE}/mrp.py",
         }
@@ -1,15 +1,17 @@
 import pandas as pd
 from typing import Dict, Any, Optional
-from utilsforecast.evaluation import evaluate
-from utilsforecast.losses import mae, mape
-import altair as alt
 import os
-from typing import List, Union, Dict, Any, Tuple
+import heapq
+from collections import OrderedDict
+from typing import List, Union, Dict, Any, Tuple, Iterator
 from enum import Enum
+from dataclasses import dataclass
 import numpy as np
 from typing import Union, Dict, List, Any
 from typing import Optional, Union
-from statsmodels import api as sm
+from .data import RollingOriginSplitter
+from .kernels import holt, holt_winters_additive, intermittent, moving_average, prefix_slopes
+from .plotting import SharedDataChart, downsample
 
 
 ModelParam = Dict[str, Any]
@@ -17,6 +19,15 @@ ModelParamList = List[ModelParam]
 ModelParams = Dict[str, Union[ModelParam, ModelParamList]]
 
 
+@dataclass
+class IntermittentModel:
+    """Croston-family model ('croston', 'sba' or 'tsb') evaluated by `kernels.intermittent`."""
+    method: str
+    alias: str
+    alpha_d: float = 0.1
+    alpha_p: float = 0.1
+
+
 class DemandForecaster:
     """
     Trains and forecasts demand using benchmark and ES models via StatsForecast,
@@ -36,15 +47,29 @@ class DemandForecaster:
           - 'holt_winters':     [{'season_length': int, 'alpha': float,
                                   'beta': float, 'gamma': float,
                                   'damped': bool, 'alias': str}, ...]
+          - 'croston':          [{'alpha': float, 'alias': str}, ...]
+          - 'sba':              [{'alpha': float, 'alias': str}, ...]
+          - 'tsb':              [{'alpha_d': float, 'alpha_p': float, 'alias': str}, ...]
         Each value may be a single dict or a list of dicts; missing entries use one optimized model.
-        To skip an entire family, set its value to an empty list.
+        To skip an entire family, set its value to an empty list. The intermittent-demand
+        families (Croston, SBA, TSB) are only included when configured; they run for all
+        series at once on a padded panel instead of through StatsForecast.
+    n_jobs : int, optional
+        Number of processes StatsForecast uses within a single fit/forecast call.
+    refit_every : int, optional
+        Number of new periods after which `update` refits all models on the full
+        history; None never refits automatically.
     """
 
-    def __init__(self, freq: str = "W", model_params: Optional[ModelParams] = None):
+    def __init__(self, freq: str = "W", model_params: Optional[ModelParams] = None,
+                 n_jobs: int = 1, refit_every: Optional[int] = None):
 
         from statsforecast import StatsForecast
 
         self.freq = freq
+        self.n_jobs = n_jobs
+        self.refit_every = refit_every
+        self._raw_model_params = model_params
         # Normalize params: wrap single dicts into lists
         raw = model_params or {}
         self.model_params: Dict[str, ModelParamList] = {}
@@ -57,9 +82,9 @@ class DemandForecaster:
                 raise ValueError(f"model_params['{key}'] must be dict or list of dicts")
 
         self._build_models()
-        self.sf = StatsForecast(models=self.models, freq=self.freq)
+        self.sf = StatsForecast(models=self.models, freq=self.freq, n_jobs=self.n_jobs)
         self.sf_optimized = StatsForecast(
-            models=self.optimized_models, freq=self.freq
+            models=self.optimized_models, freq=self.freq, n_jobs=self.n_jobs
         )
 
     def _build_models(self):
@@ -136,6 +161,18 @@ class DemandForecaster:
             else:
                 raise ValueError("Cannot set Holt-Winters parameters")
 
+        # 6) Intermittent demand (Croston, SBA, TSB): vectorized over series, off by default
+        self.intermittent_models = []
+        for method, default_alias in (("croston", "Croston"), ("sba", "SBA")):
+            for cfg in mp.get(method, []):
+                alpha = cfg.get("alpha", 0.1)
+                alias = cfg.get("alias", default_alias)
+                self.intermittent_models.append(IntermittentModel(method, alias, alpha, alpha))
+        for cfg in mp.get("tsb", []):
+            self.intermittent_models.append(IntermittentModel(
+                "tsb", cfg.get("alias", "TSB"), cfg.get("alpha_d", 0.1), cfg.get("alpha_p", 0.1)
+            ))
+
         self.optimized_models = [
             model for model, is_opt in zip(self.models, self.is_optimized) if is_opt
         ]
@@ -182,8 +219,150 @@ class DemandForecaster:
         """
         self.sf.fit(df, id_col="unique_id", time_col="date", target_col="demand")
         self.sf_optimized.fit(df, id_col="unique_id", time_col="date", target_col="demand")
+
+        # state for `update`: full history (for refits) and the last values per series
+        self.history_ = df[["unique_id", "date", "demand"]]
+        window_sizes = [getattr(model, "window_size", 1) for model in self.models]
+        self._tail_length = max(window_sizes + [1])
+        tails = df.sort_values("date").groupby("unique_id", observed=True).tail(self._tail_length)
+        self._tails = {
+            uid: values.values.astype(float)
+            for uid, values in tails.groupby("unique_id", observed=True)["demand"]
+        }
+        self._periods_since_fit = 0
+        self._intermittent_state = self._fit_intermittent(df, np.asarray(self.sf.uids))
+        return self
+
+    @property
+    def history_(self) -> pd.DataFrame:
+        """All observations seen by fit and update; update chunks are concatenated on access."""
+        parts = self.__dict__.get("_history_parts")
+        if parts is None:
+            raise AttributeError("history_")
+        if len(parts) > 1:
+            parts[:] = [pd.concat(parts, ignore_index=True)]
+        return parts[0]
+
+    @history_.setter
+    def history_(self, df: pd.DataFrame):
+        self._history_parts = [df]
+
+    @property
+    def aliases(self) -> List[str]:
+        """Forecast column names of all configured models, in output order."""
+        return [model.alias for model in self.models] + [
+            model.alias for model in self.intermittent_models
+        ]
+
+    def _fit_intermittent(
+        self, df: pd.DataFrame, uids: np.ndarray, state: Optional[Dict[str, np.ndarray]] = None
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """Run (or continue) the intermittent-demand recursions for the series `uids` of `df`."""
+        if not self.intermittent_models:
+            return None
+        return self._fit_intermittent_panel(_padded_panel(df, uids)[0], state)
+
+    def _fit_intermittent_panel(
+        self, y: np.ndarray, state: Optional[Dict[str, np.ndarray]] = None
+    ) -> Dict[str, np.ndarray]:
+        return intermittent(
+            y,
+            [model.alpha_d for model in self.intermittent_models],
+            [model.alpha_p for model in self.intermittent_models],
+            state,
+        )
+
+    def _add_intermittent(self, forecast: pd.DataFrame, state: Optional[Dict[str, np.ndarray]],
+                          uids: np.ndarray) -> pd.DataFrame:
+        """Append the flat Croston / SBA / TSB forecasts of `state` to a forecast frame."""
+        if state is None:
+            return forecast
+        points = _intermittent_points(state, self.intermittent_models)
+        rows = pd.Index(uids).get_indexer(forecast["unique_id"])
+        for model, values in zip(self.intermittent_models, points):
+            forecast[model.alias] = values[rows]
+        return forecast
+
+    def update(self, new_rows: pd.DataFrame, refit: Optional[bool] = None) -> "DemandForecaster":
+        """
+        Advance the fitted models by newly observed periods without refitting.
+
+        Naive, WindowAverage, SES (fixed or previously optimized alpha) and the
+        intermittent-demand models advance their forecast state by the new observations.
+        Holt and AutoETS keep their estimated parameters and run the ETS state recursion
+        over the new observations only. All models are refitted on the full history when
+        `refit` is True, when the `refit_every` schedule is due, or when `new_rows`
+        contains unseen series. Between refits, prediction-interval variances are those
+        of the last fit. The new rows are only appended to `history_`, so the cost of an
+        update does not grow with the length of the history.
+
+        Parameters
+        ----------
+        new_rows : pd.DataFrame
+            Long-format DataFrame with columns ['unique_id', 'date', 'demand'] holding
+            only periods after the last date seen for each series.
+        refit : bool, optional
+            Force (True) or suppress (False) a refit; None follows `refit_every`.
+        """
+        if not hasattr(self, "history_"):
+            raise ValueError("Call fit before update.")
+        new_rows = new_rows[["unique_id", "date", "demand"]].sort_values(["unique_id", "date"])
+        if new_rows.empty:
+            return self
+
+        last_dates = pd.Series(self.sf.last_dates, index=np.asarray(self.sf.uids))
+        known = new_rows["unique_id"].isin(last_dates.index)
+        if (new_rows.loc[known, "date"] <= new_rows.loc[known, "unique_id"].map(last_dates)).any():
+            raise ValueError("new_rows must only contain dates after the last date of each series.")
+
+        self._history_parts.append(new_rows)
+        self._periods_since_fit += int(new_rows.groupby("unique_id", observed=True).size().max())
+        if refit is None:
+            refit = self.refit_every is not None and self._periods_since_fit >= self.refit_every
+        if refit or not known.all():
+            return self.fit(self.history_)
+
+        position = {uid: i for i, uid in enumerate(last_dates.index)}
+        dates = last_dates.values.copy()
+        for uid, rows in new_rows.groupby("unique_id", sort=False, observed=True):
+            i = position[uid]
+            y = rows["demand"].values.astype(float)
+            self._tails[uid] = np.concatenate([self._tails[uid], y])[-self._tail_length:]
+            for j in range(len(self.sf.models)):
+                self._advance(self.sf.fitted_[i, j], y, self._tails[uid])
+            dates[i] = rows["date"].values[-1]
+        self.sf.last_dates = pd.DatetimeIndex(dates, name=self.sf.last_dates.name)
+        self._intermittent_state = self._fit_intermittent(
+            new_rows, last_dates.index.values, self._intermittent_state
+        )
         return self
 
+    @staticmethod
+    def _advance(model, y: np.ndarray, tail: np.ndarray):
+        """Advance one fitted StatsForecast model by the observations `y`."""
+        from statsforecast.models import (
+            Naive,
+            WindowAverage,
+            SimpleExponentialSmoothing,
+            SimpleExponentialSmoothingOptimized,
+        )
+
+        state = model.model_
+        if isinstance(model, Naive):
+            state["mean"] = np.array([y[-1]])
+        elif isinstance(model, WindowAverage):
+            q = model.window_size
+            state["mean"] = np.array([tail[-q:].mean() if len(tail) >= q else np.nan])
+        elif isinstance(model, (SimpleExponentialSmoothing, SimpleExponentialSmoothingOptimized)):
+            alpha, level = state["alpha"], state["mean"][0]
+            for value in y:
+                level = alpha * value + (1 - alpha) * level
+            state["mean"] = np.array([level])
+        elif "states" in state:
+            state["states"] = np.vstack([state["states"], _ets_advance(state, y)])
+        else:
+            raise ValueError(f"Cannot update {model.__class__.__name__} without refitting.")
+
     def forecast(self, h: int) -> pd.DataFrame:
         """
         Forecast the next `h` periods for all series and models.
@@ -198,30 +377,637 @@ class DemandForecaster:
         pd.DataFrame
             A DataFrame with columns ['unique_id','date',<model_aliases>].
         """
-        return self.sf.predict(h=h)
+        return self._add_intermittent(
+            self.sf.predict(h=h), self._intermittent_state, np.asarray(self.sf.uids)
+        )
 
-    def cross_validation(self, **kwargs) -> pd.DataFrame:
+    def forecast_intervals(
+        self,
+        h: int,
+        level: Tuple[int, ...] = (80, 95),
+        n_paths: int = 1000,
+        chunk_size: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> pd.DataFrame:
         """
-        Perform cross-validation on the fitted models.
+        Point forecasts with bootstrap prediction intervals for all series and models.
+
+        For every (series, model) pair the in-sample one-step residuals are resampled
+        into an (n_paths x h) error array and propagated to the h-step errors with the
+        model's additive state-space weights (c_0 = 1, c_j = alpha + beta * phi_j +
+        gamma * [j mod m == 0]): Naive uses alpha = 1, SES its alpha, Holt / AutoETS
+        their fitted parameters, and WindowAverage treats errors as independent around
+        the window mean. Intermittent-demand models get point forecasts only. This is a
+        single batched matrix product per chunk of series; `chunk_size` bounds the memory
+        to chunk_size * n_paths * h values.
 
         Parameters
         ----------
-        **kwargs : dict
-            Additional parameters for cross-validation.
+        h : int
+            Forecast horizon (number of periods ahead).
+        level : tuple of int
+            Interval coverages in percent.
+        n_paths : int
+            Number of simulated future paths per series and model.
+        chunk_size : int, optional
+            Series per chunk; defaults to about 4M simulated values per chunk.
+        seed : int, optional
+            Seed for the residual resampling.
 
         Returns
         -------
         pd.DataFrame
-            A DataFrame with cross-validation results.
+            The `forecast(h)` frame plus '<alias>-lo-<level>' and '<alias>-hi-<level>'
+            columns, in the StatsForecast layout.
         """
+        if not hasattr(self, "history_"):
+            raise ValueError("Call fit before forecast_intervals.")
+        forecast = self.forecast(h)
+        n_series = len(self.sf.uids)
+        chunk_size = chunk_size or max(1, (1 << 22) // (n_paths * h))
+        rng = np.random.default_rng(seed)
+        level = sorted(level)
+        quantiles = np.array(
+            [0.5 - lv / 200 for lv in reversed(level)] + [0.5 + lv / 200 for lv in level]
+        )
+        history = self.history_.sort_values("date")
+        histories = {
+            uid: values.values.astype(float)
+            for uid, values in history.groupby("unique_id", observed=True)["demand"]
+        }
+        lags = np.subtract.outer(np.arange(h), np.arange(h))
+
+        for j, model in enumerate(self.sf.models):
+            mean = forecast[model.alias].values.reshape(n_series, h)
+            bounds = np.empty((n_series, len(quantiles), h))
+            for start in range(0, n_series, chunk_size):
+                rows = range(start, min(start + chunk_size, n_series))
+                pools, weights = [], []
+                for i in rows:
+                    fitted = self.sf.fitted_[i, j]
+                    pools.append(_residuals(fitted, histories[self.sf.uids[i]]))
+                    weights.append(_error_weights(fitted, h))
+                lengths = np.array([len(pool) for pool in pools])
+                padded = np.zeros((len(pools), max(lengths.max(), 1)))
+                for k, pool in enumerate(pools):
+                    padded[k, :len(pool)] = pool
+
+                # (series, paths, h) resampled one-step errors -> h-step errors
+                draws = (rng.random((len(pools), n_paths, h)) * lengths[:, None, None]).astype(int)
+                errors = np.take_along_axis(padded, draws.reshape(len(pools), -1), axis=1)
+                errors = errors.reshape(len(pools), n_paths, h)
+                weights = np.stack(weights)
+                propagation = np.where(lags >= 0, weights[:, np.maximum(lags, 0)], 0.0)
+                paths = errors @ propagation.transpose(0, 2, 1)
+                chunk = np.quantile(paths, quantiles, axis=1).transpose(1, 0, 2)
+                chunk[lengths == 0] = np.nan
+                bounds[start:start + len(pools)] = chunk
+
+            bounds = mean[:, None, :] + bounds
+            names = [f"{model.alias}-lo-{lv}" for lv in reversed(level)] + [
+                f"{model.alias}-hi-{lv}" for lv in level
+            ]
+            for q, name in enumerate(names):
+                forecast[name] = bounds[:, q, :].ravel()
+        return forecast
 
-        self.sf_optimized.cross_validation(
-            **kwargs, id_col="unique_id", time_col="date", target_col="demand",refit=False)
+    @staticmethod
+    def _balanced_shards(df: pd.DataFrame, n_shards: int) -> List[np.ndarray]:
+        """
+        Partition unique_ids into `n_shards` groups with roughly equal total length.
 
-        return self.sf.cross_validation(
-            **kwargs, id_col="unique_id", time_col="date", target_col="demand",
+        Longest-processing-time greedy: series are assigned, longest first, to the
+        shard with the fewest observations so far.
+        """
+        sizes = df.groupby("unique_id", sort=False, observed=True).size().sort_values(ascending=False)
+        n_shards = max(1, min(n_shards, len(sizes)))
+        heap = [(0, shard) for shard in range(n_shards)]
+        members: List[List[Any]] = [[] for _ in range(n_shards)]
+        for uid, size in sizes.items():
+            load, shard = heapq.heappop(heap)
+            members[shard].append(uid)
+            heapq.heappush(heap, (load + size, shard))
+        return [np.array(ids, dtype=object) for ids in members if ids]
+
+    def iter_forecast_shards(
+        self,
+        df: pd.DataFrame,
+        h: int,
+        n_shards: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Fit and forecast balanced shards of series in worker processes, yielding each
+        shard's forecasts as soon as it finishes.
+
+        At most two shards per worker are in flight, so only those slices of `df` are
+        copied to the workers at any time. Workers use StatsForecast's memory-efficient
+        `forecast`, which does not keep fitted models once a shard is done.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Long-format DataFrame with columns ['unique_id', 'date', 'demand'].
+        h : int
+            Forecast horizon (number of periods ahead).
+        n_shards : int, optional
+            Number of shards; defaults to four per worker for load balancing.
+        max_workers : int, optional
+            Number of worker processes; defaults to the number of CPUs.
+        """
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        max_workers = max_workers or os.cpu_count() or 1
+        shards = self._balanced_shards(df, n_shards or 4 * max_workers)
+        row_groups = df.groupby("unique_id", sort=False, observed=True).indices
+        max_pending = 2 * max_workers
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            pending = set()
+            for ids in shards:
+                rows = np.concatenate([row_groups[uid] for uid in ids])
+                pending.add(pool.submit(
+                    _forecast_shard, self.freq, self._raw_model_params, df.iloc[rows], h
+                ))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in pending:
+                yield future.result()
+
+    def forecast_sharded(
+        self,
+        df: pd.DataFrame,
+        h: int,
+        n_shards: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Fit and forecast all series in balanced shards across a process pool.
+
+        Equivalent to `fit(df).forecast(h)` for large panels (thousands of series);
+        see `iter_forecast_shards` for the parameters.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame with columns ['unique_id','date',<model_aliases>], sorted by series and date.
+        """
+        forecasts = list(self.iter_forecast_shards(df, h, n_shards, max_workers))
+        return (
+            pd.concat(forecasts, ignore_index=True)
+            .sort_values(["unique_id", "date"])
+            .reset_index(drop=True)
         )
 
+    def cross_validation(self, df: pd.DataFrame, h: int, n_windows: int = 1,
+                         step_size: int = 1, race: bool = False, race_alpha: float = 0.05,
+                         race_min_windows: int = 3, **kwargs) -> pd.DataFrame:
+        """
+        Perform rolling-origin cross-validation, fitting every model once per window.
+
+        Fixed-parameter models run through StatsForecast's cross-validation. Optimized
+        models (Holt, Holt-Winters) are fitted window by window so that their estimated
+        parameters can be kept; they are available afterwards as `cv_params_`.
+        Intermittent-demand models carry one vectorized recursion across all cutoffs.
+
+        With `race=True` the windows are evaluated oldest first and a model stops being
+        fitted for a series once its per-window MAE is significantly worse than that of
+        the series' current best model (see `_cross_validate_race`); its forecasts are
+        NaN from then on. The per-series ranking of all models is kept as `leaderboard_`.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Long-format DataFrame with columns ['unique_id', 'date', 'demand'].
+        h : int
+            Forecast horizon of each window.
+        n_windows : int
+            Number of windows.
+        step_size : int
+            Periods between consecutive cutoffs.
+        race : bool
+            Eliminate dominated models per series while moving through the windows.
+        race_alpha : float
+            Significance level of the one-sided paired t-test used for elimination.
+        race_min_windows : int
+            Windows a model is evaluated on before it can be eliminated.
+        **kwargs : dict
+            Additional parameters for StatsForecast.cross_validation (not used when racing).
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame with columns ['unique_id','date','cutoff','demand',<model_aliases>].
+        """
+        from statsforecast import StatsForecast
+
+        if race:
+            return self._cross_validate_race(
+                df, h, n_windows, step_size, race_alpha, race_min_windows
+            )
+
+        keys = ["unique_id", "date", "cutoff"]
+        fixed_models = [
+            model for model, is_opt in zip(self.models, self.is_optimized) if not is_opt
+        ]
+
+        result = None
+        if fixed_models:
+            sf = StatsForecast(models=fixed_models, freq=self.freq, n_jobs=self.n_jobs)
+            result = sf.cross_validation(
+                df=df, h=h, n_windows=n_windows, step_size=step_size, **kwargs,
+                id_col="unique_id", time_col="date", target_col="demand",
+            )
+
+        self.cv_params_ = pd.DataFrame()
+        if self.optimized_models:
+            optimized = self._cross_validate_optimized(df, h, n_windows, step_size)
+            if result is None:
+                result = optimized
+            else:
+                result = result.merge(optimized.drop(columns="demand"), on=keys, how="left")
+
+        if self.intermittent_models:
+            sparse = self._cross_validate_intermittent(df, h, n_windows, step_size)
+            if result is None:
+                result = sparse
+            else:
+                result = result.merge(sparse.drop(columns="demand"), on=keys, how="left")
+
+        return result[keys + ["demand"] + self.aliases]
+
+    def _cross_validate_intermittent(self, df: pd.DataFrame, h: int, n_windows: int,
+                                     step_size: int) -> pd.DataFrame:
+        """
+        Rolling-origin forecasts of the intermittent-demand models for all series at once.
+
+        The padded panel is right-aligned, so every window's cutoff is one column; the
+        recursion state is carried from one cutoff to the next instead of being rerun.
+        """
+        uids = np.sort(df["unique_id"].unique())
+        y, dates = _padded_panel(df, uids)
+        n = y.shape[1]
+
+        frames, state, start = [], None, 0
+        for window in range(n_windows):
+            cutoff = n - h - step_size * (n_windows - 1 - window) - 1
+            state = self._fit_intermittent_panel(y[:, start:cutoff + 1], state)
+            start = cutoff + 1
+            points = _intermittent_points(state, self.intermittent_models)
+
+            target = y[:, cutoff + 1:cutoff + 1 + h]
+            series, step = np.nonzero(~np.isnan(target) & ~np.isnat(dates[:, cutoff])[:, None])
+            frame = pd.DataFrame({
+                "unique_id": uids[series],
+                "date": dates[series, cutoff + 1 + step],
+                "cutoff": dates[series, cutoff],
+                "demand": target[series, step],
+            })
+            for model, values in zip(self.intermittent_models, points):
+                frame[model.alias] = values[series]
+            frames.append(frame)
+        return pd.concat(frames, ignore_index=True)
+
+    def _cross_validate_optimized(self, df: pd.DataFrame, h: int, n_windows: int,
+                                  step_size: int) -> pd.DataFrame:
+        """Fit the optimized models once per window and record their parameters."""
+        from statsforecast import StatsForecast
+
+        splitter = RollingOriginSplitter(h=h, n_windows=n_windows, step_size=step_size).fit(df)
+        df = splitter.data_
+        sf = StatsForecast(models=self.optimized_models, freq=self.freq, n_jobs=self.n_jobs)
+
+        forecasts, params = [], []
+        for split in splitter.windows():
+            train = df.take(split.train_positions())
+            test = df.take(split.test_positions())
+
+            sf.fit(train, id_col="unique_id", time_col="date", target_col="demand")
+            cutoffs = train.groupby("unique_id", observed=True)["date"].max().rename("cutoff")
+            fc = (
+                sf.predict(h=h)
+                .merge(cutoffs.reset_index(), on="unique_id")
+                .merge(test[["unique_id", "date", "demand"]], on=["unique_id", "date"])
+            )
+            forecasts.append(fc)
+            params.extend(self._fitted_params(sf, cutoffs))
+
+        self.cv_params_ = pd.DataFrame(params)
+        return pd.concat(forecasts, ignore_index=True)
+
+    def _cross_validate_race(self, df: pd.DataFrame, h: int, n_windows: int, step_size: int,
+                             alpha: float, min_windows: int) -> pd.DataFrame:
+        """
+        Rolling-origin cross-validation that drops dominated models per series.
+
+        After every window each surviving model is compared with the series' best
+        surviving model (lowest mean per-window MAE) by a one-sided paired t-test on the
+        per-window MAE differences; models worse at level `alpha` after at least
+        `min_windows` windows are not fitted for that series again. Optimized models,
+        which dominate the fitting time, are fitted per window only on the series they
+        are still alive for; the cheap fixed-parameter and intermittent-demand models
+        run once for all windows and are masked after their elimination.
+
+        Sets `leaderboard_` with one row per (series, model): windows evaluated, mean
+        MAE, the window after which the model was eliminated (NaN for survivors) and its
+        rank (survivors by MAE first, then models by how long they lasted).
+        """
+        from scipy.stats import t as student_t
+        from statsforecast import StatsForecast
+
+        keys = ["unique_id", "date", "cutoff"]
+        aliases = self.aliases
+        splitter = RollingOriginSplitter(h=h, n_windows=n_windows, step_size=step_size).fit(df)
+        df = splitter.data_
+        uids = splitter.uids_
+        n_series, n_models = len(uids), len(aliases)
+
+        fixed_models = [
+            model for model, is_opt in zip(self.models, self.is_optimized) if not is_opt
+        ]
+        cheap = []
+        if fixed_models:
+            sf = StatsForecast(models=fixed_models, freq=self.freq, n_jobs=self.n_jobs)
+            cheap.append(sf.cross_validation(
+                df=df, h=h, n_windows=n_windows, step_size=step_size,
+                id_col="unique_id", time_col="date", target_col="demand",
+            ).drop(columns="demand"))
+        if self.intermittent_models:
+            cheap.append(self._cross_validate_intermittent(
+                df, h, n_windows, step_size
+            ).drop(columns="demand"))
+
+        errors = np.full((n_windows, n_series, n_models), np.nan)
+        alive = np.ones((n_series, n_models), dtype=bool)
+        eliminated = np.full((n_series, n_models), np.nan)
+        forecasts, params = [], []
+        for window, split in enumerate(splitter.windows()):
+            train = df.take(split.train_positions())
+            test = df.take(split.test_positions())
+            cutoffs = train.groupby("unique_id", observed=True)["date"].max().rename("cutoff")
+            fc = test[["unique_id", "date", "demand"]].merge(cutoffs.reset_index(), on="unique_id")
+
+            for frame in cheap:
+                fc = fc.merge(frame, on=keys, how="left")
+            for j, model in enumerate(self.models):
+                if not self.is_optimized[j]:
+                    continue
+                ids = uids[alive[:, j]]
+                if not len(ids):
+                    fc[model.alias] = np.nan
+                    continue
+                sf = StatsForecast(models=[model], freq=self.freq, n_jobs=self.n_jobs)
+                sf.fit(train[train["unique_id"].isin(ids)],
+                       id_col="unique_id", time_col="date", target_col="demand")
+                fc = fc.merge(sf.predict(h=h), on=["unique_id", "date"], how="left")
+                params.extend(self._fitted_params(sf, cutoffs.loc[ids]))
+
+            codes = pd.Index(uids).get_indexer(fc["unique_id"])
+            values = np.where(alive[codes], fc[aliases].values.astype(float), np.nan)
+            fc[aliases] = values
+            forecasts.append(fc)
+            errors[window] = _segment_mean(
+                np.abs(values - fc["demand"].values[:, None]), codes, n_series
+            )
+            errors[window][~alive] = np.nan
+
+            # paired t-test of every surviving model against the series' best survivor
+            with np.errstate(divide="ignore", invalid="ignore"):
+                seen = errors[:window + 1]
+                mean_error = np.nansum(seen, axis=0) / np.sum(~np.isnan(seen), axis=0)
+                mean_error = np.where(alive, np.nan_to_num(mean_error, nan=np.inf), np.inf)
+                best = np.argmin(mean_error, axis=1)
+                diff = seen - seen[:, np.arange(n_series), best][:, :, None]
+                n = np.sum(~np.isnan(diff), axis=0)
+                mean_diff = np.nansum(diff, axis=0) / n
+                sd_diff = np.sqrt(np.nansum((diff - mean_diff) ** 2, axis=0) / (n - 1))
+                t_stat = np.where(sd_diff > 0, mean_diff * np.sqrt(n) / sd_diff,
+                                  np.where(mean_diff > 0, np.inf, 0.0))
+                critical = student_t.ppf(1 - alpha, np.maximum(n - 1, 1))
+            dominated = alive & (n >= min_windows) & (t_stat > critical)
+            alive &= ~dominated
+            eliminated[dominated] = window
+
+        self.cv_params_ = pd.DataFrame(params)
+        windows = np.sum(~np.isnan(errors), axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_error = np.nansum(errors, axis=0) / windows
+        board = pd.DataFrame({
+            "unique_id": np.repeat(uids, n_models),
+            "alias": np.tile(aliases, n_series),
+            "windows": windows.ravel(),
+            "mae": mean_error.ravel(),
+            "eliminated_after": eliminated.ravel(),
+        })
+        board["_lasted"] = board["eliminated_after"].fillna(n_windows)
+        board = board.sort_values(
+            ["unique_id", "_lasted", "mae"], ascending=[True, False, True]
+        ).drop(columns="_lasted")
+        board["rank"] = board.groupby("unique_id", observed=True).cumcount() + 1
+        self.leaderboard_ = board.reset_index(drop=True)
+
+        result = pd.concat(forecasts, ignore_index=True)
+        return result[keys + ["demand"] + aliases]
+
+    @staticmethod
+    def _fitted_params(sf, cutoffs: pd.Series) -> List[Dict[str, Any]]:
+        """Smoothing parameters of every fitted (series, model) pair of a StatsForecast object."""
+        records = []
+        for i, uid in enumerate(sf.uids):
+            for j, model in enumerate(sf.models):
+                par = getattr(sf.fitted_[i, j], "model_", {}).get("par")
+                record = {
+                    "unique_id": uid,
+                    "cutoff": cutoffs.loc[uid],
+                    "alias": model.alias,
+                    "type": model.__class__.__name__,
+                }
+                if par is not None:
+                    record.update(zip(["alpha", "beta", "gamma", "phi"], par[:4]))
+                records.append(record)
+        return records
+
+
+def _residuals(model, history: np.ndarray) -> np.ndarray:
+    """In-sample one-step residuals of a fitted StatsForecast model (NaNs dropped)."""
+    state = model.model_
+    if "actual_residuals" in state:
+        residuals = state["actual_residuals"]
+    elif "residuals" in state:
+        residuals = state["residuals"]
+    else:
+        # WindowAverage keeps no fitted values: residuals against the trailing window mean
+        q = getattr(model, "window_size", 1)
+        residuals = history[q:] - moving_average(history, [q])[0, q - 1:-1]
+    residuals = np.asarray(residuals, dtype=float)
+    return residuals[~np.isnan(residuals)]
+
+
+def _error_weights(model, h: int) -> np.ndarray:
+    """
+    Weights c_0..c_{h-1} of past one-step errors in the h-step error of an additive
+    state-space model: e_{n+k} + sum_j c_j * e_{n+k-j}.
+    """
+    from statsforecast.models import Naive, SimpleExponentialSmoothing, SimpleExponentialSmoothingOptimized
+
+    state = model.model_
+    steps = np.arange(h)
+    weights = np.zeros(h)
+    if isinstance(model, Naive):
+        weights[1:] = 1.0
+    elif isinstance(model, (SimpleExponentialSmoothing, SimpleExponentialSmoothingOptimized)):
+        weights[1:] = state["alpha"]
+    elif "states" in state:
+        _, trend, season, damped = state["components"][:4]
+        alpha, beta, gamma, phi = state["par"][:4]
+        weights[1:] = alpha
+        if trend == "A":
+            phi = phi if damped == "D" else 1.0
+            damped_steps = np.cumsum(phi ** steps) - 1 if phi != 1.0 else steps.astype(float)
+            weights[1:] += beta * damped_steps[1:]
+        if season == "A":
+            weights[1:] += gamma * (steps[1:] % state["m"] == 0)
+    weights[0] = 1.0
+    return weights
+
+
+def _ets_advance(model: Dict[str, Any], y: np.ndarray) -> np.ndarray:
+    """
+    Run the state recursion of a fitted additive ETS model (StatsForecast / R `ets`
+    layout: states [level, trend, s_1..s_m] with s_1 the most recent season) over `y`.
+
+    Returns one state row per observation.
+    """
+    error, trend, season, damped = model["components"][:4]
+    if error != "A" or trend not in "AN" or season not in "AN":
+        raise ValueError(f"Only additive ETS models can be updated, got {model['components']}.")
+    alpha, beta, gamma, phi = model["par"][:4]
+    phi = phi if damped == "D" else 1.0
+    has_trend, has_season = trend == "A", season == "A"
+    m = model["m"] if has_season else 0
+
+    state = model["states"][-1].copy()
+    rows = np.empty((len(y), len(state)))
+    for t, value in enumerate(y):
+        old_level = state[0]
+        damped_trend = phi * state[1] if has_trend else 0.0
+        q = old_level + damped_trend
+        old_season = state[-1] if has_season else 0.0
+        level = q + alpha * (value - old_season - q)
+        if has_trend:
+            state[1] = damped_trend + beta / alpha * (level - old_level - damped_trend)
+        if has_season:
+            state[-m + 1:], state[-m] = state[-m:-1].copy(), old_season + gamma * (value - q - old_season)
+        state[0] = level
+        rows[t] = state
+    return rows
+
+
+def _forecast_shard(freq: str, model_params: Optional[ModelParams],
+                    df: pd.DataFrame, h: int) -> pd.DataFrame:
+    """Worker entry point for DemandForecaster.iter_forecast_shards."""
+    forecaster = DemandForecaster(freq=freq, model_params=model_params)
+    forecast = forecaster.sf.forecast(
+        df=df, h=h, id_col="unique_id", time_col="date", target_col="demand"
+    )
+    uids = forecast["unique_id"].unique()
+    return forecaster._add_intermittent(forecast, forecaster._fit_intermittent(df, uids), uids)
+
+
+def _padded_panel(df: pd.DataFrame, uids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Right-aligned (series, time) demand and date arrays of a long frame, rows in `uids`
+    order; shorter series are padded with NaN / NaT at the start.
+    """
+    df = df.sort_values(["unique_id", "date"])
+    rows = pd.Index(uids).get_indexer(df["unique_id"])
+    from_end = df.groupby("unique_id", sort=False, observed=True).cumcount(ascending=False).values
+    n = int(from_end.max()) + 1 if len(df) else 0
+    cols = n - 1 - from_end
+    y = np.full((len(uids), n), np.nan)
+    y[rows, cols] = df["demand"].values
+    dates = np.full((len(uids), n), np.datetime64("NaT"), dtype="datetime64[ns]")
+    dates[rows, cols] = pd.to_datetime(df["date"]).values
+    return y, dates
+
+
+def _intermittent_points(state: Dict[str, np.ndarray], models: List[IntermittentModel]) -> np.ndarray:
+    """(models, series) flat forecasts from an intermittent recursion state; 0 before any demand."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        croston = state["size"] / state["interval"]
+        points = np.empty_like(croston)
+        for k, model in enumerate(models):
+            if model.method == "tsb":
+                points[k] = state["probability"][k] * state["size"][k]
+            elif model.method == "sba":
+                points[k] = (1 - model.alpha_d / 2) * croston[k]
+            else:
+                points[k] = croston[k]
+    return np.nan_to_num(points, nan=0.0)
+
+
+METRICS = ["mae", "mape", "smape", "rmse", "mase", "bias"]
+
+
+def _error_stats(y: np.ndarray, fc: np.ndarray, scale: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Row-level error statistics for a (rows x models) forecast block.
+
+    Returns an array of shape (rows, 9, models) holding absolute error, absolute
+    percentage error, symmetric percentage error, squared error, signed error
+    (forecast - actual), scaled absolute error and the counts behind them. Undefined
+    entries (missing forecasts, zero demand for MAPE, missing scale for MASE) are
+    zero and excluded from the counts, so the statistics can simply be summed.
+    """
+    y = y[:, None]
+    err = fc - y
+    valid = ~np.isnan(err)
+    err = np.where(valid, err, 0.0)
+    abs_err = np.abs(err)
+    ape_valid = valid & (y != 0)
+    denominator = np.abs(y) + np.abs(np.where(valid, fc, 0.0))
+    if scale is None:
+        scale = np.full(len(y), np.nan)
+    scale = scale[:, None]
+    scaled_valid = valid & (scale > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ape = np.where(ape_valid, abs_err / np.abs(y), 0.0)
+        sape = np.where(valid & (denominator > 0), abs_err / denominator, 0.0)
+        scaled = np.where(scaled_valid, abs_err / scale, 0.0)
+    return np.stack(
+        [abs_err, ape, sape, err ** 2, err, scaled, valid, ape_valid, scaled_valid], axis=1
+    ).astype(float)
+
+
+def _metrics_from_stats(stats: np.ndarray) -> np.ndarray:
+    """Turn summed `_error_stats` (..., 9, models) into METRICS (..., 6, models); NaN if undefined."""
+    abs_err, ape, sape, sq, err, scaled, n, n_ape, n_scaled = np.moveaxis(stats, -2, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        metrics = [abs_err / n, ape / n_ape, sape / n, np.sqrt(sq / n), scaled / n_scaled, err / n]
+    return np.stack(metrics, axis=-2)
+
+
+def _segment_mean(values: np.ndarray, codes: np.ndarray, n_groups: int) -> np.ndarray:
+    """NaN-ignoring mean of `values` rows per group code."""
+    present = ~np.isnan(values)
+    sums = np.zeros((n_groups,) + values.shape[1:])
+    counts = np.zeros_like(sums)
+    np.add.at(sums, codes, np.where(present, values, 0.0))
+    np.add.at(counts, codes, present)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return sums / counts
+
+
+def _long_metrics(metrics: np.ndarray, index: pd.Index, models: List[str]) -> pd.DataFrame:
+    """Long layout like utilsforecast.evaluate: one row per (key, metric), one column per model."""
+    return pd.DataFrame(
+        metrics.reshape(len(index) * len(METRICS), len(models)),
+        index=pd.MultiIndex.from_product([index, METRICS], names=[index.name, "metric"]),
+        columns=models,
+    ).reset_index()
+
 
 class Evaluator:
 
@@ -250,43 +1036,138 @@ class Evaluator:
         return df.rename({"mae": f"mae_{suffix}", "mape": f"mape_{suffix}"})
 
     def _get_model_columns(self, df: pd.DataFrame) -> List[str]:
-        return
-
-    def evaluate(self) -> pd.DataFrame:
-
-        model_cols = [
+        return [
             col
-            for col in self.forecast.columns
+            for col in df.columns
             if col
             not in [self.date_col, self.actual_col, self.unique_id_col, self.cutoff_col]
         ]
 
-        evaluation_fc: dict = (
-            evaluate(
-                df=self.forecast,
-                models=model_cols,
-                time_col=self.date_col,
-                target_col=self.actual_col,
-                id_col=self.unique_id_col,
-                metrics=[mae, mape],
+    def _scales(self, windows: pd.DataFrame, train_df: pd.DataFrame,
+                season_length: int) -> pd.Series:
+        """
+        MASE scale per (series, cutoff) window: mean absolute seasonal difference of
+        the training data up to the cutoff (the whole series if there is no cutoff).
+        """
+        train = train_df.sort_values([self.unique_id_col, self.date_col])
+        y = train[self.actual_col].values.astype(float)
+        ids = train[self.unique_id_col].values
+        same_series = np.zeros(len(y), dtype=bool)
+        same_series[season_length:] = ids[season_length:] == ids[:-season_length]
+        diffs = np.zeros(len(y))
+        diffs[season_length:] = np.abs(y[season_length:] - y[:-season_length])
+        cum_diff = np.cumsum(np.where(same_series, diffs, 0.0))
+        cum_count = np.cumsum(same_series)
+
+        bounds = train.groupby(self.unique_id_col, sort=False, observed=True).indices
+        dates = pd.to_datetime(train[self.date_col]).values
+        cutoffs = windows["_cutoff"].values
+        scales = np.full(len(windows), np.nan)
+        for i, (uid, cutoff) in enumerate(zip(windows[self.unique_id_col], cutoffs)):
+            rows = bounds.get(uid)
+            if rows is None:
+                continue
+            first, last = rows[0], rows[-1] + 1
+            if not pd.isnull(cutoff):
+                last = first + np.searchsorted(dates[first:last], cutoff, side="right")
+            if last - first <= season_length:
+                continue
+            start = first + season_length - 1
+            total = cum_diff[last - 1] - cum_diff[start]
+            count = cum_count[last - 1] - cum_count[start]
+            scales[i] = total / count
+        return pd.Series(scales, index=windows.index)
+
+    def score(
+        self,
+        df: Optional[pd.DataFrame] = None,
+        train_df: Optional[pd.DataFrame] = None,
+        season_length: int = 1,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Score all model columns in one pass over a (rows x models) NumPy block.
+
+        Computes MAE, MAPE, sMAPE, RMSE, MASE and bias per (series, cutoff) window
+        (as utilsforecast does) and aggregates them without further groupbys.
+
+        Parameters
+        ----------
+        df : pd.DataFrame, optional
+            Forecast frame with actuals; defaults to the forecast passed at construction.
+        train_df : pd.DataFrame, optional
+            Demand history used as MASE scale; MASE is NaN without it.
+        season_length : int
+            Lag of the naive forecast used for the MASE scale.
+
+        Returns
+        -------
+        Dict[str, pd.DataFrame]
+            'overall' (index: metric, averaged over windows), and long-format breakdowns
+            'series' and 'cutoff' (averaged over windows) and 'horizon' (pooled per step).
+        """
+        df = self.forecast if df is None else df
+        models = self._get_model_columns(df)
+        has_cutoff = self.cutoff_col in df.columns
+        keys = [self.unique_id_col] + ([self.cutoff_col] if has_cutoff else [])
+        df = df.sort_values(keys + [self.date_col])
+
+        # contiguous (series, cutoff) windows after sorting
+        window_codes = df.groupby(keys, sort=False, observed=True).ngroup().values
+        starts = np.flatnonzero(np.r_[True, window_codes[1:] != window_codes[:-1]])
+        window_of_row = np.cumsum(np.r_[False, window_codes[1:] != window_codes[:-1]])
+        windows = pd.DataFrame({
+            self.unique_id_col: df[self.unique_id_col].values[starts],
+            "_cutoff": pd.to_datetime(df[self.cutoff_col].values[starts]) if has_cutoff else None,
+        })
+
+        scale = None
+        if train_df is not None:
+            scale = self._scales(windows, train_df, season_length).values[window_of_row]
+
+        stats = _error_stats(
+            df[self.actual_col].values.astype(float), df[models].values.astype(float), scale
+        )
+        window_metrics = _metrics_from_stats(np.add.reduceat(stats, starts, axis=0))
+
+        n_windows = len(starts)
+        overall = _segment_mean(window_metrics, np.zeros(n_windows, dtype=int), 1)[0]
+        result = {
+            "overall": pd.DataFrame(
+                overall, index=pd.Index(METRICS, name=self.metric_col), columns=models
             )
-            .groupby(self.metric_col)[model_cols]
-            .mean()
-            .to_dict()
+        }
+
+        series_codes, series_index = pd.factorize(windows[self.unique_id_col], sort=False)
+        result["series"] = _long_metrics(
+            _segment_mean(window_metrics, series_codes, len(series_index)),
+            pd.Index(series_index, name=self.unique_id_col), models,
         )
 
-        evaluation_hist = (
-            evaluate(
-                df=self.historic_forecast,
-                models=model_cols,
-                time_col=self.date_col,
-                target_col=self.actual_col,
-                id_col=self.unique_id_col,
-                metrics=[mae, mape],
+        if has_cutoff:
+            cutoff_codes, cutoff_index = pd.factorize(windows["_cutoff"], sort=True)
+            result["cutoff"] = _long_metrics(
+                _segment_mean(window_metrics, cutoff_codes, len(cutoff_index)),
+                pd.Index(cutoff_index, name=self.cutoff_col), models,
+            )
+
+            steps = np.arange(len(df)) - starts[window_of_row]
+            step_stats = np.zeros((steps.max() + 1,) + stats.shape[1:])
+            np.add.at(step_stats, steps, stats)
+            result["horizon"] = _long_metrics(
+                _metrics_from_stats(step_stats),
+                pd.Index(np.arange(1, len(step_stats) + 1), name="horizon"), models,
             )
-            .groupby(self.metric_col)[model_cols]
-            .mean()
-            .to_dict()
+        return result
+
+    def evaluate(self) -> pd.DataFrame:
+
+        def summarize(df: pd.DataFrame) -> dict:
+            return self.score(df)["overall"].loc[["mae", "mape"]].to_dict()
+
+        evaluation_fc: dict = summarize(self.forecast)
+
+        evaluation_hist = (
+            summarize(self.historic_forecast)
         ) if not self.historic_forecast.empty else None
 
         # Merge evaluations
@@ -295,68 +1176,592 @@ class Evaluator:
         return evaluation
 
 
+class StreamingEvaluator:
+    """
+    Incremental forecast evaluation over batches of a (possibly huge) backtest.
+
+    Batches are consumed with `update` (e.g. one per cutoff or per chunk of series) and
+    only running sums are kept, so the full forecast frame never has to be in memory.
+    Each (series, cutoff) window must be contained in a single batch.
+
+    Metrics follow `Evaluator.score`: they are computed per (series, cutoff) window and
+    averaged over windows; per-horizon metrics pool all windows at each step ahead.
+    MASE requires `scales`, the naive in-sample MAE per series.
+    """
+
+    METRICS = METRICS
+
+    def __init__(
+        self,
+        models: Optional[List[str]] = None,
+        cutoff_col: str = "cutoff",
+        date_col: str = "date",
+        actual_col: str = "demand",
+        unique_id_col: str = "unique_id",
+        scales: Optional[pd.Series] = None,
+    ):
+        self.models = models
+        self.cutoff_col = cutoff_col
+        self.date_col = date_col
+        self.actual_col = actual_col
+        self.unique_id_col = unique_id_col
+        self.scales = scales
+
+        self._series_ids: Dict[Any, int] = {}
+        # per series: summed window metrics and the number of windows where each is defined
+        self._series_sums = None
+        self._series_counts = None
+        # per horizon step: pooled `_error_stats`
+        self._horizon_sums = None
+
+    def _model_columns(self, batch: pd.DataFrame) -> List[str]:
+        keys = [self.date_col, self.actual_col, self.unique_id_col, self.cutoff_col]
+        return [col for col in batch.columns if col not in keys]
+
+    def _series_codes(self, ids: np.ndarray) -> np.ndarray:
+        for uid in ids:
+            if uid not in self._series_ids:
+                self._series_ids[uid] = len(self._series_ids)
+        shape = (len(METRICS), len(self.models))
+        if self._series_sums is None:
+            self._series_sums = np.zeros((0,) + shape)
+            self._series_counts = np.zeros((0,) + shape)
+        grow = len(self._series_ids) - len(self._series_sums)
+        if grow > 0:
+            self._series_sums = np.concatenate([self._series_sums, np.zeros((grow,) + shape)])
+            self._series_counts = np.concatenate([self._series_counts, np.zeros((grow,) + shape)])
+        return np.array([self._series_ids[uid] for uid in ids], dtype=int)
+
+    def update(self, batch: pd.DataFrame) -> "StreamingEvaluator":
+        """Add a batch of forecasts with actuals to the running sums."""
+        if batch.empty:
+            return self
+        if self.models is None:
+            self.models = self._model_columns(batch)
+
+        has_cutoff = self.cutoff_col in batch.columns
+        window_keys = [self.unique_id_col] + ([self.cutoff_col] if has_cutoff else [])
+        batch = batch.sort_values(window_keys + [self.date_col])
+
+        scale = None
+        if self.scales is not None:
+            scale = batch[self.unique_id_col].map(self.scales).values.astype(float)
+        stats = _error_stats(
+            batch[self.actual_col].values.astype(float), batch[self.models].values.astype(float), scale
+        )
+
+        # window sums -> window metrics -> per-series sums of window metrics
+        windows = batch.groupby(window_keys, sort=False, observed=True).ngroup().values
+        starts = np.flatnonzero(np.r_[True, windows[1:] != windows[:-1]])
+        window_metrics = _metrics_from_stats(np.add.reduceat(stats, starts, axis=0))
+        present = ~np.isnan(window_metrics)
+
+        codes = self._series_codes(batch[self.unique_id_col].values[starts])
+        np.add.at(self._series_sums, codes, np.where(present, window_metrics, 0.0))
+        np.add.at(self._series_counts, codes, present)
+
+        # pooled sums per horizon step
+        if has_cutoff:
+            steps = batch.groupby(window_keys, sort=False, observed=True).cumcount().values
+            n_steps = steps.max() + 1
+            if self._horizon_sums is None:
+                self._horizon_sums = np.zeros((n_steps,) + stats.shape[1:])
+            elif n_steps > len(self._horizon_sums):
+                grow = np.zeros((n_steps - len(self._horizon_sums),) + stats.shape[1:])
+                self._horizon_sums = np.concatenate([self._horizon_sums, grow])
+            np.add.at(self._horizon_sums, steps, stats)
+        return self
+
+    def series_metrics(self) -> pd.DataFrame:
+        """Metrics per series (averaged over the series' windows)."""
+        if self._series_sums is None:
+            return pd.DataFrame()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            metrics = self._series_sums / self._series_counts
+        index = pd.Index(list(self._series_ids), name=self.unique_id_col)
+        return _long_metrics(metrics, index, self.models)
+
+    def horizon_metrics(self) -> pd.DataFrame:
+        """Metrics per step ahead (1 = first period after the cutoff), pooled over windows."""
+        if self._horizon_sums is None:
+            return pd.DataFrame()
+        index = pd.Index(np.arange(1, len(self._horizon_sums) + 1), name="horizon")
+        return _long_metrics(_metrics_from_stats(self._horizon_sums), index, self.models)
+
+    def summary(self) -> pd.DataFrame:
+        """Metrics per model averaged over all windows seen so far (index: metric)."""
+        if self._series_sums is None:
+            return pd.DataFrame()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            metrics = self._series_sums.sum(axis=0) / self._series_counts.sum(axis=0)
+        return pd.DataFrame(metrics, index=pd.Index(METRICS, name="metric"), columns=self.models)
+
+    def evaluate(self) -> Dict[str, Dict[str, float]]:
+        """Summary in the `{model: {metric: value}}` layout used by `Evaluator` and `ForecastPlotter`."""
+        return self.summary().to_dict()
+
+
+class QuantileSketch:
+    """
+    Mergeable t-digest style sketch of a stream of values.
+
+    Values are kept as at most about `compression / 2` weighted centroids. Centroids
+    are sized with the arcsine scale function, so they are small near the tails and
+    extreme quantiles (P99) stay accurate. Sketches built on different workers are
+    combined with `merge`, which gives the same guarantees as sketching all values at once.
+    """
+
+    def __init__(self, compression: int = 200):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+        self._buffer: List[np.ndarray] = []
+        self._buffered = 0
+
+    @property
+    def count(self) -> float:
+        self._flush()
+        return float(self.weights.sum())
+
+    def update(self, values) -> "QuantileSketch":
+        """Add values to the sketch; NaNs are ignored."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self._buffer.append(values)
+        self._buffered += len(values)
+        if self._buffered >= 10 * self.compression:
+            self._flush()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Merge another sketch into this one."""
+        other._flush()
+        self._flush()
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(
+            np.concatenate([self.means, other.means]),
+            np.concatenate([self.weights, other.weights]),
+        )
+        return self
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        values = np.concatenate(self._buffer)
+        self._buffer, self._buffered = [], 0
+        self._compress(
+            np.concatenate([self.means, values]),
+            np.concatenate([self.weights, np.ones(len(values))]),
+        )
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray):
+        if len(means) == 0:
+            return
+        order = np.argsort(means, kind="mergesort")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        # k-scale position of every centroid's centre; one bucket per unit of k
+        q = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression / (2 * np.pi) * (np.arcsin(2 * q - 1) + np.pi / 2)
+        bucket = np.floor(k).astype(int)
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def quantile(self, q) -> np.ndarray:
+        """Approximate quantile(s) `q` in [0, 1]; NaN for an empty sketch."""
+        self._flush()
+        q = np.asarray(q, dtype=float)
+        if len(self.means) == 0:
+            return np.full(q.shape, np.nan)
+        total = self.weights.sum()
+        centres = (np.cumsum(self.weights) - self.weights / 2) / total
+        return np.interp(
+            q, np.r_[0.0, centres, 1.0], np.r_[self.min, self.means, self.max]
+        )
+
+
+class ErrorDistribution:
+    """
+    Fleet-wide distribution of per-series forecast errors, one `QuantileSketch` per
+    (metric, model).
+
+    Memory is constant per model regardless of the number of series. Feed it per-series
+    metrics (e.g. `Evaluator.score()['series']`) or scored batches of whole series with
+    `update_forecast`; distributions built per shard or worker are combined with `merge`.
+    Error values are fractions as in `Evaluator` (0.1 = 10% MAPE).
+    """
+
+    def __init__(
+        self,
+        metrics: Optional[List[str]] = None,
+        compression: int = 200,
+        unique_id_col: str = "unique_id",
+        metric_col: str = "metric",
+    ):
+        self.metrics = metrics or ["mae", "mape", "smape", "rmse", "bias"]
+        self.compression = compression
+        self.unique_id_col = unique_id_col
+        self.metric_col = metric_col
+        self.sketches: Dict[Tuple[str, str], QuantileSketch] = {}
+
+    def _sketch(self, metric: str, model: str) -> QuantileSketch:
+        key = (metric, model)
+        if key not in self.sketches:
+            self.sketches[key] = QuantileSketch(self.compression)
+        return self.sketches[key]
+
+    def update(self, series_metrics: pd.DataFrame) -> "ErrorDistribution":
+        """
+        Add per-series metrics in the long layout [unique_id, metric, <models>].
+
+        Each series must be added only once, so batches must not split a series.
+        """
+        models = [
+            col for col in series_metrics.columns
+            if col not in [self.unique_id_col, self.metric_col]
+        ]
+        for metric, rows in series_metrics.groupby(self.metric_col, sort=False):
+            if metric not in self.metrics:
+                continue
+            for model in models:
+                self._sketch(metric, model).update(rows[model].values)
+        return self
+
+    def update_forecast(
+        self,
+        batch: pd.DataFrame,
+        train_df: Optional[pd.DataFrame] = None,
+        season_length: int = 1,
+        **evaluator_kwargs,
+    ) -> "ErrorDistribution":
+        """Score a batch of complete series (forecasts with actuals) and add their metrics."""
+        if batch.empty:
+            return self
+        scores = Evaluator(batch, **evaluator_kwargs).score(
+            train_df=train_df, season_length=season_length
+        )
+        return self.update(scores["series"])
+
+    def merge(self, other: "ErrorDistribution") -> "ErrorDistribution":
+        """Merge the sketches of another distribution (e.g. from another worker)."""
+        for (metric, model), sketch in other.sketches.items():
+            self._sketch(metric, model).merge(sketch)
+        return self
+
+    def quantiles(self, q: Tuple[float, ...] = (0.5, 0.9, 0.99)) -> pd.DataFrame:
+        """
+        Approximate error quantiles per model.
+
+        Returns
+        -------
+        pd.DataFrame
+            Index (metric, quantile), one column per model.
+        """
+        q = np.asarray(q, dtype=float)
+        models = list(dict.fromkeys(model for _, model in self.sketches))
+        metrics = [m for m in self.metrics if any(key[0] == m for key in self.sketches)]
+        values = np.full((len(metrics), len(q), len(models)), np.nan)
+        for (metric, model), sketch in self.sketches.items():
+            if metric in metrics:
+                values[metrics.index(metric), :, models.index(model)] = sketch.quantile(q)
+        index = pd.MultiIndex.from_product([metrics, q], names=[self.metric_col, "quantile"])
+        return pd.DataFrame(values.reshape(-1, len(models)), index=index, columns=models)
+
+
 class ForecastLoader:
     """
     Manages loading or generating forecasts and historic forecasts using DemandForecaster.
 
+    Generated forecasts are kept in a content-addressed cache: the key is a hash of the
+    demand frame, the model parameters and the horizon/CV settings, and entries are
+    stored as Parquet files (pickle if no Parquet engine is installed). When the cache
+    exceeds `max_cache_bytes`, the least recently used entries are evicted.
+
     Attributes:
-        forecast_path (str): File path for saving/loading the forecast results.
-        historic_path (str): File path for saving/loading the historic forecast results.
+        cache_dir (str): Directory holding cached forecast artifacts.
+        max_cache_bytes (int): Upper bound for the total size of the cache directory.
     """
 
     def __init__(
         self,
-
+        cache_dir: Optional[str] = None,
+        max_cache_bytes: int = 512 * 1024 ** 2,
     ):
         self.date_col = "date"
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.expanduser("~"), ".cache", "om_lecture", "forecasts"
+        )
+        self.max_cache_bytes = max_cache_bytes
+
+    @staticmethod
+    def _cache_key(data: pd.DataFrame, settings: Dict[str, Any]) -> str:
+        """SHA-256 over the demand frame contents and the forecast settings."""
+        import hashlib
+        import json
+
+        digest = hashlib.sha256()
+        frame = data[["unique_id", "date", "demand"]]
+        digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+        digest.update(
+            json.dumps(
+                settings, sort_keys=True,
+                default=lambda o: o.item() if hasattr(o, "item") else str(o),
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    def _cache_entries(self) -> List[str]:
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith((".parquet", ".pkl"))
+        ]
 
-    def _load(self, path: str) -> pd.DataFrame:
+    def _cache_lookup(self, key: str) -> Optional[str]:
+        for path in self._cache_entries():
+            if os.path.splitext(os.path.basename(path))[0] == key:
+                return path
+        return None
+
+    def _cache_store(self, key: str, df: pd.DataFrame) -> str:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, f"{key}.parquet")
+        tmp_path = f"{path}.tmp"
+        try:
+            try:
+                df.to_parquet(tmp_path, index=False)
+            except ImportError:
+                path = os.path.join(self.cache_dir, f"{key}.pkl")
+                tmp_path = f"{path}.tmp"
+                df.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            # a partial write would linger: _evict only sees finished entries
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._evict()
+        return path
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits into max_cache_bytes."""
+        entries = sorted(self._cache_entries(), key=os.path.getmtime)
+        total = sum(os.path.getsize(path) for path in entries)
+        while entries and total > self.max_cache_bytes:
+            path = entries.pop(0)
+            total -= os.path.getsize(path)
+            os.remove(path)
+
+    def load_or_forecast(
+        self,
+        data: pd.DataFrame,
+        freq: str = "W",
+        model_params: Optional[ModelParams] = None,
+        h: int = 4,
+        n_windows: Optional[int] = None,
+        step_size: Optional[int] = None,
+    ) -> pd.DataFrame:
         """
-        Loads a DataFrame from CSV or pickle based on file extension.
+        Return the cached forecast for these inputs, or run DemandForecaster and cache it.
+
+        Args:
+            data (pd.DataFrame): Long-format demand with columns ['unique_id', 'date', 'demand'].
+            freq (str): Pandas frequency string passed to DemandForecaster.
+            model_params (dict, optional): Model configuration passed to DemandForecaster.
+            h (int): Forecast horizon.
+            n_windows (int, optional): If given, run cross-validation with this many windows
+                (as used for the forecast / historic forecast artifacts) instead of a
+                plain forecast after the end of `data`.
+            step_size (int, optional): Step between cross-validation cutoffs; defaults to h.
+
+        Returns:
+            pd.DataFrame: Forecast (or cross-validation) frame.
+        """
+        settings = {
+            "freq": freq,
+            "model_params": {
+                key: [val] if isinstance(val, dict) else val
+                for key, val in (model_params or {}).items()
+            },
+            "h": h,
+            "n_windows": n_windows,
+            "step_size": (step_size or h) if n_windows is not None else None,
+        }
+        key = self._cache_key(data, settings)
+
+        path = self._cache_lookup(key)
+        if path is not None:
+            os.utime(path)  # mark as recently used
+            return self._load(path)
+
+        forecaster = DemandForecaster(freq=freq, model_params=model_params)
+        if n_windows is None:
+            df = forecaster.fit(data).forecast(h=h)
+        else:
+            df = forecaster.cross_validation(
+                df=data, h=h, n_windows=n_windows, step_size=settings["step_size"]
+            )
+        # serve the stored copy so a miss returns the same frame as a later hit
+        path = self._cache_store(key, df.reset_index(drop=True))
+        if os.path.exists(path):
+            return self._load(path)
+        return df.reset_index(drop=True)  # evicted right away: larger than the whole cache
+
+    def _projection(self, available: List[str], models: Optional[List[str]]) -> Optional[List[str]]:
+        """Key columns plus the requested model columns, in file order."""
+        if models is None:
+            return None
+        keys = {"unique_id", self.date_col, "cutoff", "demand"}
+        missing = set(models) - set(available)
+        if missing:
+            raise KeyError(f"Model columns not found: {sorted(missing)}")
+        return [col for col in available if col in keys or col in models]
+
+    def _arrow_filter(self, schema, unique_ids=None, cutoffs=None, start=None, end=None):
+        """
+        pyarrow filter expression for the requested rows, or None for all rows.
+
+        Date conditions are only pushed down for timestamp columns; `_frame_filter`
+        handles the rest after conversion.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        def is_timestamp(col):
+            return col in schema.names and pa.types.is_timestamp(schema.field(col).type)
+
+        conditions = []
+        if unique_ids is not None:
+            conditions.append(pc.field("unique_id").isin(list(unique_ids)))
+        if cutoffs is not None and is_timestamp("cutoff"):
+            values = pa.array(pd.to_datetime(list(cutoffs))).cast(schema.field("cutoff").type)
+            conditions.append(pc.field("cutoff").isin(values))
+        if start is not None and is_timestamp(self.date_col):
+            conditions.append(pc.field(self.date_col) >= pa.scalar(pd.Timestamp(start)))
+        if end is not None and is_timestamp(self.date_col):
+            conditions.append(pc.field(self.date_col) <= pa.scalar(pd.Timestamp(end)))
+        if not conditions:
+            return None
+        expr = conditions[0]
+        for cond in conditions[1:]:
+            expr = expr & cond
+        return expr
+
+    def _frame_filter(self, df: pd.DataFrame, unique_ids=None, cutoffs=None,
+                      start=None, end=None) -> pd.DataFrame:
+        """Row filter for formats without predicate pushdown (CSV, pickle)."""
+        mask = np.ones(len(df), dtype=bool)
+        if unique_ids is not None:
+            mask &= df["unique_id"].isin(list(unique_ids)).values
+        if cutoffs is not None and "cutoff" in df.columns:
+            mask &= pd.to_datetime(df["cutoff"]).isin(pd.to_datetime(list(cutoffs))).values
+        if start is not None:
+            mask &= (df[self.date_col] >= pd.Timestamp(start)).values
+        if end is not None:
+            mask &= (df[self.date_col] <= pd.Timestamp(end)).values
+        return df if mask.all() else df[mask]
+
+    def _load(
+        self,
+        path: str,
+        models: Optional[List[str]] = None,
+        unique_ids: Optional[List[str]] = None,
+        cutoffs: Optional[List[Any]] = None,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+    ) -> pd.DataFrame:
+        """
+        Loads a DataFrame from CSV, Parquet, Arrow/Feather or pickle based on file extension.
+
+        Only the key columns and `models` are materialized (all columns if None), and rows
+        can be restricted to `unique_ids`, `cutoffs` and the date range [start, end].
+        Parquet and Arrow files are memory-mapped and filtered before conversion to pandas.
         """
         ext = os.path.splitext(path)[1].lower()
-        if ext == ".csv":
-            df = pd.read_csv(path, index_col=0, parse_dates=True)
+        if ext in (".parquet", ".arrow", ".feather"):
+            import pyarrow.feather as feather
+            import pyarrow.parquet as pq
+
+            if ext == ".parquet":
+                schema = pq.read_schema(path)
+                table = pq.read_table(
+                    path,
+                    columns=self._projection(schema.names, models),
+                    filters=self._arrow_filter(schema, unique_ids, cutoffs, start, end),
+                    memory_map=True,
+                )
+            else:
+                table = feather.read_table(path, memory_map=True)
+                expr = self._arrow_filter(table.schema, unique_ids, cutoffs, start, end)
+                columns = self._projection(table.column_names, models)
+                if columns is not None:
+                    table = table.select(columns)
+                if expr is not None:
+                    table = table.filter(expr)
+            df = table.to_pandas()
+        elif ext == ".csv":
+            available = list(pd.read_csv(path, nrows=0).columns)
+            columns = self._projection(available[1:], models)
+            df = pd.read_csv(
+                path, index_col=0, parse_dates=True,
+                usecols=None if columns is None else [0] + [available.index(col) for col in columns],
+            )
         elif ext in (".pkl", ".pickle"):
             df = pd.read_pickle(path)
+            columns = self._projection(list(df.columns), models)
+            if columns is not None:
+                df = df[columns]
         else:
             raise ValueError(f"Unsupported file extension: {ext}")
         df[self.date_col] = pd.to_datetime(df[self.date_col])
-        return df
-
-        
-
+        return self._frame_filter(df, unique_ids, cutoffs, start, end)
 
     def load_data(
         self,
         forecast_path: str,
         historic_path: Optional[str] = None,
+        models: Optional[List[str]] = None,
+        unique_ids: Optional[List[str]] = None,
+        cutoffs: Optional[List[Any]] = None,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
     ) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Load or persist the provided DataFrames to forecast_path / historic_path.
         Does NOT run any forecasting or use DemandForecaster anymore.
 
         Args:
-            data (pd.DataFrame): DataFrame to save/load as the 'forecast' artifact.
-            history (pd.DataFrame): DataFrame to save/load as the 'historic forecast' artifact.
-            n_windows, step_size, h, historic_n_windows: kept for compatibility but unused.
+            forecast_path (str): Path of the 'forecast' artifact.
+            historic_path (str, optional): Path of the 'historic forecast' artifact.
+            models (list of str, optional): Model columns to load; all if None.
+            unique_ids (list of str, optional): Only load these series.
+            cutoffs (list, optional): Only load these cutoff dates.
+            start, end (optional): Only load rows with start <= date <= end.
 
         Returns:
-            If historic_path and historic_n_windows provided: (forecast_df, historic_df)
+            If historic_path provided: (forecast_df, historic_df)
             Otherwise: forecast_df
         """
-        forecast = self._load(forecast_path)
+        selection = dict(models=models, unique_ids=unique_ids, cutoffs=cutoffs, start=start, end=end)
+        forecast = self._load(forecast_path, **selection)
 
         if historic_path is None:
             return forecast
         else:
-            historic_forecast = self._load(historic_path)
+            historic_forecast = self._load(historic_path, **selection)
             return forecast, historic_forecast
 
 
-    
-
-
 class PlotMode(Enum):
     HISTORY = "history"
     FORECAST = "forecast"
@@ -389,6 +1794,8 @@ class ForecastPlotter:
         history_label: str = "Historical Demand",
         actuals_label: str = "Actuals",
         horizon_label: str = "Forecast Horizon",
+        max_points: Optional[int] = None,
+        cache_size: int = 32,
     ):
         self.history = history.copy()
         self.actuals = actuals.copy()
@@ -406,20 +1813,59 @@ class ForecastPlotter:
         self.history_label = history_label
         self.actuals_label = actuals_label
         self.horizon_label = horizon_label
+        # point budget per line layer (LTTB downsampling); None plots every row
+        self.max_points = max_points
+        # LRU cache of built charts keyed by plot arguments and a fingerprint of the data
+        self.cache_size = cache_size
+        self._chart_cache: "OrderedDict[tuple, alt.LayerChart]" = OrderedDict()
+        self._fingerprint: Optional[str] = None
+
+    def _data_fingerprint(self) -> str:
+        """SHA-256 over the attached frames and metrics; computed once per data change."""
+        if self._fingerprint is None:
+            import hashlib
+
+            digest = hashlib.sha256()
+            for frame in [self.history, self.actuals, self.forecast, self.historic_forecast]:
+                digest.update(repr(list(frame.columns)).encode())
+                digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+            digest.update(repr(self.metrics).encode())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def _invalidate(self):
+        self._chart_cache.clear()
+        self._fingerprint = None
+
+    def _boundaries(self) -> List[pd.Timestamp]:
+        """Dates that must survive downsampling: the actuals start and every historic forecast window start."""
+        boundaries = []
+        if not self.actuals.empty:
+            boundaries.append(self.actuals[self.date_col].min())
+        if not self.historic_forecast.empty:
+            if "cutoff" in self.historic_forecast.columns:
+                starts = self.historic_forecast.groupby("cutoff")[self.date_col].min()
+                boundaries.extend(starts.tolist())
+            else:
+                boundaries.append(self.historic_forecast[self.date_col].min())
+        return boundaries
 
     def add_forecast(self, forecast: pd.DataFrame):
         """Add forecast DataFrame (must contain date_col and model forecast column)."""
         self.forecast = forecast.copy()
+        self._invalidate()
         return
 
     def add_historic_forecast(self, historic_forecast: pd.DataFrame):
         """Add historic forecast DataFrame (must contain date_col and model forecast column)."""
         self.historic_forecast = historic_forecast.copy()
+        self._invalidate()
         return
 
     def add_metrics(self, metrics: pd.DataFrame):
         """Add performance metrics DataFrame (indexed by metric_col)."""
         self.metrics = metrics.copy()
+        self._invalidate()
         return
 
     def plot(
@@ -430,14 +1876,45 @@ class ForecastPlotter:
         vertical_line: bool = True,
         shade: bool = True,
         plot_mode: Union[str, PlotMode] = PlotMode.FORECAST,
-    ) -> alt.Chart:
+    ) -> "alt.Chart":
         """
         Return an Altair chart with history, actuals, optional forecast, and metrics annotation.
+
+        With `max_points` set, each line layer is reduced to about that many points with
+        LTTB, keeping extremes and the forecast window boundaries.
+
+        Charts are cached (up to `cache_size`, least recently used first out), so repeated
+        argument combinations are returned without rebuilding. The returned chart is shared
+        with the cache and should not be modified in place.
         """
 
         plot_mode = (
             PlotMode.from_str(plot_mode) if isinstance(plot_mode, str) else plot_mode
         )
+        key = (model_col, title, forecast_label, vertical_line, shade, plot_mode,
+               self.max_points, self._data_fingerprint())
+        if key in self._chart_cache:
+            self._chart_cache.move_to_end(key)
+            return self._chart_cache[key]
+
+        chart = self._build_chart(model_col, title, forecast_label, vertical_line, shade, plot_mode)
+        if self.cache_size > 0:
+            self._chart_cache[key] = chart
+            if len(self._chart_cache) > self.cache_size:
+                self._chart_cache.popitem(last=False)
+        return chart
+
+    def _build_chart(
+        self,
+        model_col: Optional[str],
+        title: str,
+        forecast_label: Optional[str],
+        vertical_line: bool,
+        shade: bool,
+        plot_mode: PlotMode,
+    ) -> "alt.LayerChart":
+        """Build the layered chart for `plot` (uncached)."""
+        import altair as alt
 
         metrics_descr = ""
 
@@ -452,6 +1929,8 @@ class ForecastPlotter:
 
         # Combine history + actuals for base line
         base = pd.concat([self.history, self.actuals], ignore_index=True)
+        boundaries = self._boundaries()
+        base = downsample(base, self.date_col, [self.actual_col], self.max_points, keep=boundaries)
 
         # Base line chart
         line_all = (
@@ -483,8 +1962,11 @@ class ForecastPlotter:
         if plot_mode == PlotMode.FORECAST and not self.forecast.empty:
 
             fc_label = forecast_label or f"{model_col} Forecast"
+            forecast = downsample(
+                self.forecast, self.date_col, [model_col], self.max_points, keep=boundaries
+            )
             line_fc = (
-                alt.Chart(self.forecast)
+                alt.Chart(forecast)
                 .mark_line(color="orange")
                 .encode(
                     x=alt.X(f"{self.date_col}:T"),
@@ -503,8 +1985,11 @@ class ForecastPlotter:
         elif plot_mode == PlotMode.HISTORY and not self.historic_forecast.empty:
 
             fc_label = forecast_label or f"{model_col} Forecast"
+            historic_forecast = downsample(
+                self.historic_forecast, self.date_col, [model_col], self.max_points, keep=boundaries
+            )
             line_fc = (
-                alt.Chart(self.historic_forecast)
+                alt.Chart(historic_forecast)
                 .mark_line(color="orange")
                 .encode(
                     x=alt.X(f"{self.date_col}:T"),
@@ -650,47 +2135,63 @@ class HoltDoubleExpPlotter:
         df = df.copy()
         df[date_col] = pd.to_datetime(df[date_col])
         df[cutoff_col] = pd.to_datetime(df[cutoff_col])
-        df = df.sort_values(date_col)
+        # unique row labels: forecast_df_ keeps them, and plot() aligns on them
+        df = df.sort_values(date_col).reset_index(drop=True)
         self.history_ = df
 
-        forecasts = []
-        for cutoff in df[cutoff_col].unique():
-            hist_df = df[df[date_col] <= cutoff]
-            if len(hist_df) < 2:
-                continue
-            y = hist_df[value_col].values
-            n = len(y)
-            level = np.zeros(n)
-            trend = np.zeros(n)
-
-            # initial trend via OLS
-            X = sm.add_constant(np.arange(n))
-            model = sm.OLS(y, X).fit()
-            trend[0] = model.params[1]
-            level[0] = y[0]
-
-            # smoothing
-            for t in range(1, n):
-                level[t] = alpha * y[t] + (1 - alpha) * (level[t-1] + trend[t-1])
-                trend[t] = beta * (level[t] - level[t-1]) + (1 - beta) * trend[t-1]
-
-            # forecast
-            future_df = df[df[cutoff_col] == cutoff].copy()
-            h = np.arange(1, len(future_df) + 1)
-            last_level = level[-1]
-            last_trend = trend[-1]
-            future_df['forecast'] = last_level + h * last_trend
-            future_df['level'] = last_level
-            future_df['trend'] = h * last_trend
-
-            forecasts.append(future_df)
-
-        if forecasts:
-            self.forecast_df_ = pd.concat(forecasts).sort_values(date_col)
+        # Each cutoff sees the sorted history up to and including the cutoff date,
+        # i.e. a prefix of `y` whose length we find by binary search.
+        y = df[value_col].values.astype(float)
+        # rows without a cutoff get no forecast (searchsorted would place NaT last)
+        cutoffs = df[cutoff_col].dropna().unique()
+        ends = np.searchsorted(df[date_col].values, cutoffs, side='right')
+        levels, trends = self._rolling_origin_states(y, ends, alpha, beta)
+
+        # forecast: h steps ahead of each cutoff, for all windows at once
+        valid = ends >= 2
+        future_df = df[df[cutoff_col].isin(cutoffs[valid])].copy()
+        h = future_df.groupby(cutoff_col).cumcount().values + 1
+        last_level = future_df[cutoff_col].map(pd.Series(levels[valid], index=cutoffs[valid])).values
+        last_trend = future_df[cutoff_col].map(pd.Series(trends[valid], index=cutoffs[valid])).values
+        future_df['forecast'] = last_level + h * last_trend
+        future_df['level'] = last_level
+        future_df['trend'] = h * last_trend
+
+        if not future_df.empty:
+            self.forecast_df_ = future_df.sort_values(date_col)
             self._calculate_forecast_error(value_col)
             self.fitted = True
         return self
 
+    @staticmethod
+    def _rolling_origin_states(y: np.ndarray, ends: np.ndarray, alpha: float,
+                               beta: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Final level and trend of Holt's recursion on every prefix y[:end] in one pass.
+
+        Each prefix starts from level y[0] and the OLS slope of that prefix. Since the
+        recursion is affine in the initial trend, we run it once with a zero initial
+        trend and once for the response to a unit initial trend, then combine both with
+        the prefix slope (computed from running sums) at every cutoff.
+        """
+        n = len(y)
+        ends = np.asarray(ends, dtype=int)
+        levels = np.full(len(ends), np.nan)
+        trends = np.full(len(ends), np.nan)
+        if n == 0:
+            return levels, trends
+
+        slopes = prefix_slopes(y)
+        # zero initial trend on y, and the response to a unit initial trend (Holt on zeros)
+        level0, trend0 = holt(y, alpha, beta, y[0], 0.0)
+        level1, trend1 = holt(np.zeros(n), alpha, beta, 0.0, 1.0)
+
+        valid = ends >= 2
+        last = ends[valid] - 1
+        levels[valid] = level0[last] + slopes[last] * level1[last]
+        trends[valid] = trend0[last] + slopes[last] * trend1[last]
+        return levels, trends
+
     def _calculate_forecast_error(self, value_col='demand'):
         if self.forecast_df_ is None:
             return
@@ -699,29 +2200,31 @@ class HoltDoubleExpPlotter:
         self.mae_ = np.mean(np.abs(y_true - y_pred))
         self.mape_ = np.mean(np.abs((y_true - y_pred) / y_true)) * 100
 
-    def plot(self) -> alt.Chart:
+    def plot(self) -> "alt.Chart":
         """Create plot with observed values, forecast, base level, trend, and cutoff separators."""
+        import altair as alt
+
         if not self.fitted:
             raise RuntimeError("Model must be fitted before plotting.")
 
-        # Base chart for timeline
-        base = alt.Chart(self.history_).encode(x=alt.X('date:T', title='Date'))
+        # One shared frame: observations plus the components on the forecast rows
+        components = self.forecast_df_[['level', 'trend', 'forecast']].rename(
+            columns={'level': 'Level', 'trend': 'Trend', 'forecast': 'Forecast'}
+        )
+        df_plot = self.history_[['date', 'demand', 'cutoff']].join(
+            components, validate='one_to_one'
+        )
+        builder = SharedDataChart(df_plot)
 
         # Observed demand points
-        demand = base.mark_point(color='gray', opacity=0.7, size=60).encode(
+        demand = builder.base().mark_point(color='gray', opacity=0.7, size=60).encode(
+            x=alt.X('date:T', title='Date'),
             y=alt.Y('demand:Q', title='Demand / Component'),
             tooltip=['date:T', 'demand:Q']
         )
 
-        # Prepare long-format DataFrame for Level, Trend, Forecast
-        df_long = pd.concat([
-            self.forecast_df_.assign(Component='Level', Value=self.forecast_df_['level']),
-            self.forecast_df_.assign(Component='Trend', Value=self.forecast_df_['trend']),
-            self.forecast_df_.assign(Component='Forecast', Value=self.forecast_df_['forecast']),
-        ], ignore_index=True)
-
-        # Line chart with legend
-        line_chart = alt.Chart(df_long).mark_line(strokeWidth=3).encode(
+        # Line chart with legend (Level, Trend, Forecast folded into Component / Value)
+        line_chart = builder.fold(['Level', 'Trend', 'Forecast']).mark_line(strokeWidth=3).encode(
             x='date:T',
             y='Value:Q',
             color=alt.Color('Component:N',
@@ -742,13 +2245,12 @@ class HoltDoubleExpPlotter:
         )
 
         # Vertical cutoff separators
-        cutoffs = self.forecast_df_['cutoff'].unique()
-        vlines = alt.Chart(pd.DataFrame({'cutoff': cutoffs})).mark_rule(
+        vlines = builder.distinct('cutoff', where='isValid(datum.Forecast)').mark_rule(
             strokeDash=[5, 5], opacity=0.4, strokeWidth=1.5, color='black'
         ).encode(x='cutoff:T')
 
         # Combine layers
-        chart = (demand + line_chart + vlines).properties(width=800, height=400)
+        chart = builder.add(demand, line_chart, vlines).build().properties(width=800, height=400)
 
         # Add title with error metrics
         if self.mae_ is not None and self.mape_ is not None:
@@ -767,6 +2269,39 @@ class HoltDoubleExpPlotter:
         )
 
 
+@dataclass
+class HoltWintersGrid:
+    """
+    Holt-Winters components and errors for a batch of (alpha, beta, gamma) triples.
+
+    Component arrays have shape (triples, n); `mae` and `mape` hold one value per triple.
+    """
+    alpha: np.ndarray
+    beta: np.ndarray
+    gamma: np.ndarray
+    level: np.ndarray
+    trend: np.ndarray
+    seasonal: np.ndarray
+    forecast: np.ndarray
+    mae: np.ndarray
+    mape: np.ndarray
+
+    def index(self, alpha: float, beta: float, gamma: float) -> int:
+        """Row of the triple matching (alpha, beta, gamma) up to float rounding."""
+        match = np.flatnonzero(
+            np.isclose(self.alpha, alpha) & np.isclose(self.beta, beta) & np.isclose(self.gamma, gamma)
+        )
+        if len(match) == 0:
+            raise KeyError(f"(alpha={alpha}, beta={beta}, gamma={gamma}) is not part of the grid.")
+        return int(match[0])
+
+    def surface(self, metric: str = "mae") -> pd.DataFrame:
+        """Long-format error surface with one row per triple."""
+        return pd.DataFrame({
+            "alpha": self.alpha, "beta": self.beta, "gamma": self.gamma,
+            metric: getattr(self, metric),
+        })
+
 
 class HoltWintersPlotter:
     """
@@ -831,39 +2366,84 @@ class HoltWintersPlotter:
             cols[cutoff_col] = 'cutoff'
         self.history_ = df[list(cols.keys())].rename(columns=cols)
 
-        n = len(df)
-        m = seasonal_periods
-        level = np.zeros(n)
-        trend = np.zeros(n)
-        seasonal = np.zeros(n)
-        forecast = np.zeros(n)
-
-        # --- Linear Regression Initialization for Trend ---
-        y = df['demand'].iloc[:2 * m].values
-        X = sm.add_constant(np.arange(len(y)))
-        linreg = sm.OLS(y, X).fit()
-        init_level = y[:m].mean()
-        init_trend = linreg.params[1]
-
-        level[0], trend[0] = init_level, init_trend
-        for i in range(m):
-            seasonal[i] = df['demand'].iloc[i] - init_level
-
-        # Holt-Winters smoothing
-        for t in range(1, n):
-            seasonal_prev = seasonal[t - m] if t >= m else seasonal[t]
-            forecast[t] = level[t - 1] + trend[t - 1] + seasonal_prev
-            level[t] = alpha * (df['demand'].iloc[t] - seasonal_prev) + (1 - alpha) * (level[t - 1] + trend[t - 1])
-            trend[t] = beta * (level[t] - level[t - 1]) + (1 - beta) * trend[t - 1]
-            seasonal[t] = gamma * (df['demand'].iloc[t] - level[t - 1] - trend[t - 1]) + (1 - gamma) * seasonal_prev
-
-        self.level_, self.trend_, self.seasonal_, self.forecast_ = level, trend, seasonal, forecast
-        self.demand_ = df['demand'].values
+        y = df[value_col].values.astype(float)
+        level, trend, seasonal, forecast = holt_winters_additive(
+            y, seasonal_periods, np.array([alpha]), np.array([beta]), np.array([gamma])
+        )
+
+        self.level_, self.trend_, self.seasonal_, self.forecast_ = level[0], trend[0], seasonal[0], forecast[0]
+        self.demand_ = df[value_col].values
         self.fitted = True
 
         self._calculate_forecast_error()
         return self
 
+    def fit_grid(self, df: pd.DataFrame, seasonal_periods: int,
+                 alpha, beta, gamma,
+                 date_col='date', value_col='demand', cutoff_col=None) -> 'HoltWintersGrid':
+        """
+        Fit additive Holt-Winters for many (alpha, beta, gamma) triples in one pass.
+
+        The recursion runs once over time with a (triples x time) state, so a whole
+        slider grid can be precomputed and later shown via `select` without refitting.
+
+        Args:
+            df (pd.DataFrame): DataFrame with historical data.
+            seasonal_periods (int): Number of periods in a season.
+            alpha, beta, gamma (array-like): Smoothing factors, one entry per triple.
+                Use np.meshgrid(...) and ravel to evaluate a full Cartesian grid.
+            date_col (str): Column name for dates.
+            value_col (str): Column name for observed values.
+            cutoff_col (str, optional): Column name for cutoff dates to draw separators.
+
+        Returns:
+            HoltWintersGrid: Components of shape (triples, n) and MAE/MAPE per triple.
+        """
+        alpha, beta, gamma = (np.atleast_1d(np.asarray(v, dtype=float)) for v in (alpha, beta, gamma))
+        if not (alpha.shape == beta.shape == gamma.shape) or alpha.ndim != 1:
+            raise ValueError("alpha, beta and gamma must be 1-D arrays of equal length.")
+
+        self._set_params(None, None, None, seasonal_periods)
+        df = df.copy().dropna(subset=[date_col, value_col])
+        df[date_col] = pd.to_datetime(df[date_col])
+        if cutoff_col:
+            df[cutoff_col] = pd.to_datetime(df[cutoff_col])
+        df = df.sort_values(date_col).reset_index(drop=True)
+
+        cols = {date_col: 'date', value_col: 'demand'}
+        if cutoff_col:
+            cols[cutoff_col] = 'cutoff'
+        self.history_ = df[list(cols.keys())].rename(columns=cols)
+
+        y = df[value_col].values.astype(float)
+        level, trend, seasonal, forecast = holt_winters_additive(y, seasonal_periods, alpha, beta, gamma)
+
+        errors = y - forecast
+        self.grid_ = HoltWintersGrid(
+            alpha=alpha, beta=beta, gamma=gamma,
+            level=level, trend=trend, seasonal=seasonal, forecast=forecast,
+            mae=np.nanmean(np.abs(errors), axis=1),
+            mape=np.nanmean(np.abs(errors / y), axis=1) * 100,
+        )
+        self.demand_ = df[value_col].values
+        self.fitted = False
+        return self.grid_
+
+    def select(self, alpha: float, beta: float, gamma: float) -> 'HoltWintersPlotter':
+        """Show the precomputed grid entry for (alpha, beta, gamma), as if `fit` had been called."""
+        if getattr(self, 'grid_', None) is None:
+            raise RuntimeError("Call fit_grid before selecting parameters.")
+        i = self.grid_.index(alpha, beta, gamma)
+        self._set_params(alpha, beta, gamma, self.seasonal_periods)
+        self.level_ = self.grid_.level[i]
+        self.trend_ = self.grid_.trend[i]
+        self.seasonal_ = self.grid_.seasonal[i]
+        self.forecast_ = self.grid_.forecast[i]
+        self.mae_ = self.grid_.mae[i]
+        self.mape_ = self.grid_.mape[i]
+        self.fitted = True
+        return self
+
     def _calculate_forecast_error(self):
         if not self.fitted:
             raise RuntimeError("Model must be fitted before calculating forecast error.")
@@ -871,7 +2451,7 @@ class HoltWintersPlotter:
         self.mae_ = np.mean(np.abs(self.demand_[mask] - self.forecast_[mask]))
         self.mape_ = np.mean(np.abs((self.demand_[mask] - self.forecast_[mask]) / self.demand_[mask])) * 100
 
-    def plot(self) -> alt.Chart:
+    def plot(self) -> "alt.Chart":
         """
         Create an Altair chart showing:
         - Observed demand (points)
@@ -882,6 +2462,8 @@ class HoltWintersPlotter:
         - Cutoff separators (if provided)
         - Legend for components
         """
+        import altair as alt
+
         if not self.fitted:
             raise RuntimeError("Model must be fitted before plotting.")
 
@@ -890,22 +2472,15 @@ class HoltWintersPlotter:
         df_plot['Trend'] = self.trend_
         df_plot['Seasonal'] = self.seasonal_
         df_plot['Forecast'] = self.forecast_
+        builder = SharedDataChart(df_plot)
 
-        df_long = df_plot.melt(
-            id_vars=['date', 'demand'],
-            value_vars=['Level', 'Trend', 'Seasonal', 'Forecast'],
-            var_name='Component',
-            value_name='Value'
-        )
-
-        base = alt.Chart(df_plot).encode(x=alt.X('date:T', title='Date'))
-
-        demand = base.mark_point(color='gray', opacity=0.5).encode(
+        demand = builder.base().mark_point(color='gray', opacity=0.5).encode(
+            x=alt.X('date:T', title='Date'),
             y=alt.Y('demand:Q', title='Demand / Component'),
             tooltip=['date:T', 'demand:Q']
         )
 
-        line_chart = alt.Chart(df_long).mark_line(strokeWidth=3).encode(
+        line_chart = builder.fold(['Level', 'Trend', 'Seasonal', 'Forecast']).mark_line(strokeWidth=3).encode(
             x='date:T',
             y='Value:Q',
             color=alt.Color('Component:N',
@@ -926,18 +2501,17 @@ class HoltWintersPlotter:
         )
 
         # Add cutoff separators if present
-        layers = [demand, line_chart]
+        builder.add(demand, line_chart)
         if 'cutoff' in df_plot.columns:
-            cutoffs = df_plot['cutoff'].unique()
-            vlines = alt.Chart(pd.DataFrame({'cutoff': cutoffs})).mark_rule(
+            vlines = builder.distinct('cutoff').mark_rule(
                 strokeDash=[5, 5], opacity=0.4, strokeWidth=1.5, color='black'
             ).encode(x='cutoff:T')
-            layers.append(vlines)
+            builder.add(vlines)
 
         mae = int(round(self.mae_, 0))
         mape = round(self.mape_, 1)
 
-        chart = alt.layer(*layers).properties(
+        chart = builder.build().properties(
             width=800, height=400,
             title=f"Holt-Winters Additive (α: {self.alpha}, β: {self.beta}, γ: {self.gamma}), MAE: {mae}, MAPE: {mape}%"
         ).configure_title(fontSize=16, anchor='start', fontWeight='bold')
@@ -946,6 +2520,21 @@ class HoltWintersPlotter:
 
 
 
+@dataclass
+class Decomposition:
+    """
+    Trend + calendar-week seasonal decomposition of many series.
+
+    `components` has one row per observation (['unique_id', 'date', 'demand', 'trend',
+    'seasonal', 'residual']), `seasonal_indices` one row per series and one column per
+    ISO week (NaN for weeks without data), and `series` the trend intercept / slope and
+    the residual variance per series.
+    """
+    components: pd.DataFrame
+    seasonal_indices: pd.DataFrame
+    series: pd.DataFrame
+
+
 class TimeSeriesDecompositionPlotter:
     """
     A class for plotting simple time series decomposition of historic demand.
@@ -975,38 +2564,101 @@ class TimeSeriesDecompositionPlotter:
             date_col (str): Column name for dates.
             value_col (str): Column name for observed values.
         """
-        df = df.copy().dropna(subset=[date_col, value_col])
+        df = df[[date_col, value_col]].dropna()
         df[date_col] = pd.to_datetime(df[date_col])
-        df = df.sort_values(date_col).reset_index(drop=True)
-        
-        # Store history
-        self.history_ = df[[date_col, value_col]].rename(columns={date_col: 'date', value_col: 'demand'})
-        
-        n = len(df)
-        y = df[value_col].values
-        
-        # Calculate linear trend using OLS
-        X = sm.add_constant(np.arange(n))
-        trend_model = sm.OLS(y, X).fit()
-        self.trend_ = trend_model.predict(X)
-        
-        # Calculate seasonal component based on calendar week
-        df['week'] = df[date_col].dt.isocalendar().week
-        weekly_means = df.groupby('week')[value_col].mean()
-        
-        # Map weekly means to each observation
-        self.seasonal_ = df['week'].map(weekly_means).values
-        
-        # Remove the overall mean from seasonal to center it around 0
-        self.seasonal_ = self.seasonal_ - np.mean(self.seasonal_)
-        
-        # Calculate residual
-        self.residual_ = y - self.trend_ - self.seasonal_
-        
+        components = self.decompose(
+            df.assign(unique_id=0), date_col=date_col, value_col=value_col
+        ).components
+
+        # Store history with the input dtypes, in the (stable) date order of the components
+        self.history_ = (
+            df.sort_values(date_col, kind='stable').reset_index(drop=True)
+            .rename(columns={date_col: 'date', value_col: 'demand'})
+        )
+        self.trend_ = components['trend'].values
+        self.seasonal_ = components['seasonal'].values
+        self.residual_ = components['residual'].values
+
         self.fitted = True
         return self
+
+    @staticmethod
+    def decompose(df: pd.DataFrame, date_col: str = 'date', value_col: str = 'demand',
+                  unique_id_col: str = 'unique_id') -> Decomposition:
+        """
+        Decompose every series of a long-format frame at once.
+
+        Per series, the trend is the least-squares line over the observation index and
+        the seasonal component the mean per ISO calendar week, centred so that it
+        averages to zero over the series' observations. All sums are segment reductions
+        (np.bincount) over the sorted frame, so there is no per-series Python loop.
+
+        Args:
+            df (pd.DataFrame): Long-format data with unique_id, date and value columns.
+            date_col (str): Column name for dates.
+            value_col (str): Column name for observed values.
+            unique_id_col (str): Column name for the series identifier.
+
+        Returns:
+            Decomposition: components per observation, seasonal indices per series and
+            week, and trend parameters and residual variance (ddof=1) per series.
+        """
+        df = df.dropna(subset=[date_col, value_col])
+        dates = pd.to_datetime(df[date_col])
+        order = np.lexsort((dates.values, pd.factorize(df[unique_id_col], sort=True)[0]))
+        ids, uids = pd.factorize(df[unique_id_col].values[order], sort=True)
+        dates = dates.values[order]
+        y = df[value_col].values[order].astype(float)
+        n_series = len(uids)
+
+        def segment_sum(values, codes=ids, size=n_series):
+            return np.bincount(codes, weights=values, minlength=size)
+
+        # Linear trend per series on x = 0..n_i-1 (closed-form least squares)
+        n = np.bincount(ids, minlength=n_series).astype(float)
+        starts = np.r_[0, np.cumsum(n)[:-1]].astype(int)
+        x = np.arange(len(y)) - starts[ids]
+        x_mean = (n - 1) / 2
+        y_mean = segment_sum(y) / n
+        sxx = segment_sum((x - x_mean[ids]) ** 2)
+        sxy = segment_sum((x - x_mean[ids]) * (y - y_mean[ids]))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.where(sxx > 0, sxy / sxx, 0.0)
+        intercept = y_mean - slope * x_mean
+        trend = intercept[ids] + slope[ids] * x
+
+        # Calendar-week means per series, centred over the series' observations
+        week = pd.DatetimeIndex(dates).isocalendar().week.values.astype(int)
+        cell = ids * 54 + week
+        cell_count = np.bincount(cell, minlength=54 * n_series)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            week_means = segment_sum(y, cell, 54 * n_series) / cell_count
+        seasonal = week_means[cell]
+        offset = segment_sum(seasonal) / n
+        seasonal = seasonal - offset[ids]
+        residual = y - trend - seasonal
+
+        residual_mean = segment_sum(residual) / n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            residual_var = segment_sum((residual - residual_mean[ids]) ** 2) / (n - 1)
+
+        indices = (week_means.reshape(n_series, 54) - offset[:, None])[:, 1:]
+        return Decomposition(
+            components=pd.DataFrame({
+                'unique_id': uids[ids], 'date': dates, 'demand': y,
+                'trend': trend, 'seasonal': seasonal, 'residual': residual,
+            }),
+            seasonal_indices=pd.DataFrame(
+                indices, index=pd.Index(uids, name='unique_id'),
+                columns=pd.RangeIndex(1, 54, name='week'),
+            ),
+            series=pd.DataFrame({
+                'unique_id': uids, 'n_obs': n.astype(int), 'intercept': intercept,
+                'slope': slope, 'residual_var': residual_var,
+            }),
+        )
         
-    def plot(self) -> alt.Chart:
+    def plot(self) -> "alt.Chart":
         """
         Create an Altair chart showing the decomposition:
         - Original demand (gray points)
@@ -1014,6 +2666,8 @@ class TimeSeriesDecompositionPlotter:
         - Seasonal component (dashed green line)
         - Residual component (dashed blue line)
         """
+        import altair as alt
+
         if not self.fitted:
             raise RuntimeError("Model must be fitted before plotting.")
             
@@ -1021,26 +2675,17 @@ class TimeSeriesDecompositionPlotter:
         df_plot['Trend'] = self.trend_
         df_plot['Seasonal'] = self.seasonal_
         df_plot['Residual'] = self.residual_
-        
-        # Create long format for components
-        df_long = df_plot.melt(
-            id_vars=['date', 'demand'],
-            value_vars=['Trend', 'Seasonal', 'Residual'],
-            var_name='Component',
-            value_name='Value'
-        )
-        
-        # Base chart
-        base = alt.Chart(df_plot).encode(x=alt.X('date:T', title='Date'))
+        builder = SharedDataChart(df_plot)
         
         # Original demand points
-        demand = base.mark_point(color='gray', opacity=0.6, size=40).encode(
+        demand = builder.base().mark_point(color='gray', opacity=0.6, size=40).encode(
+            x=alt.X('date:T', title='Date'),
             y=alt.Y('demand:Q', title='Demand / Component'),
             tooltip=['date:T', 'demand:Q']
         )
         
-        # Component lines
-        line_chart = alt.Chart(df_long).mark_line(strokeWidth=2).encode(
+        # Component lines (folded from the shared frame)
+        line_chart = builder.fold(['Trend', 'Seasonal', 'Residual']).mark_line(strokeWidth=2).encode(
             x='date:T',
             y='Value:Q',
             color=alt.Color('Component:N',
@@ -1061,7 +2706,7 @@ class TimeSeriesDecompositionPlotter:
         )
         
         # Combine layers
-        chart = alt.layer(demand, line_chart).properties(
+        chart = builder.add(demand, line_chart).build().properties(
             width=800, 
             height=400,
             title="Time Series Decomposition: Trend + Seasonal + Residual"
@@ -17,14 +17,16 @@ products_list = [
 ]
 months_list = ["Jan", "Feb", "Mar", "Apr", "May", "Jun"]
 
-# Reproducible random data (same seed as notebook)
-np.random.seed(42)
-_demand_data = np.random.randint(500, 3000, size=(8, 6))
+# Reproducible random data (same seed and draws as the notebook's np.random.seed(42)),
+# taken from a private stream so importing this module leaves the global NumPy
+# state untouched, e.g. in the worker processes of generate_cache
+_rng = np.random.RandomState(42)
+_demand_data = _rng.randint(500, 3000, size=(8, 6))
 df_demand = pd.DataFrame(_demand_data, columns=months_list, index=products_list)
 
-_usage_per_unit = np.round(np.random.uniform(0.05, 0.15, size=8), 3)
-_batch_sizes = (np.random.randint(5, 20, size=8) * 100).astype(int)
-_setup_times = np.round(np.random.uniform(2.0, 5.0, size=8), 1)
+_usage_per_unit = np.round(_rng.uniform(0.05, 0.15, size=8), 3)
+_batch_sizes = (_rng.randint(5, 20, size=8) * 100).astype(int)
+_setup_times = np.round(_rng.uniform(2.0, 5.0, size=8), 1)
 
 df_usage = pd.DataFrame({
     "Hours/Unit": _usage_per_unit,
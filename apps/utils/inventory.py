@@ -1,8 +1,9 @@
+import os
+import sys
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass
-import altair as alt
-from scipy.stats import norm
+from .plotting import SharedDataChart, downsample
 
 
 
@@ -32,6 +33,55 @@ class EOQCalculator:
     
 
 
+def _qr_costs(demands: np.ndarray, q: np.ndarray, r: np.ndarray, K: float, H: float,
+              S_cost: float, L: int) -> np.ndarray:
+    """
+    Average cost per period of every (Q, R) pair in one pass over the demand history.
+
+    The inventory, pipeline and cost counters of all len(q) x len(r) candidates are
+    arrays, so each period is a handful of vectorized operations. Arrivals for the
+    next L periods are kept in a ring buffer of L + 1 slots. The dynamics are those of
+    `QRPolicy._simulate_cost`: arrivals are received first, an order is placed when
+    inventory plus the arrivals due in periods i .. i+L-1 is at most R, and it arrives
+    L periods later (never if that is past the horizon or L = 0); holding and
+    shortage are charged on the inventory after demand.
+
+    Returns an array of shape (len(q), len(r)).
+    """
+    demands = np.asarray(demands, dtype=np.int64)
+    q = np.asarray(q, dtype=np.int64)[:, None]
+    r = np.asarray(r, dtype=np.int64)[None, :]
+    n = len(demands)
+    shape = (q.shape[0], r.shape[1])
+
+    inventory = np.broadcast_to(r, shape).copy()
+    ring = np.zeros((L + 1,) + shape, dtype=np.int64)
+    pipeline = np.zeros(shape, dtype=np.int64)  # sum over the ring: arrivals due in i .. i+L-1
+    orders = np.zeros(shape, dtype=np.int64)
+    held = np.zeros(shape, dtype=np.int64)
+    short = np.zeros(shape, dtype=np.int64)
+    quantity = np.broadcast_to(q, shape)
+
+    for i in range(n):
+        slot = i % (L + 1)
+        inventory += ring[slot]
+        order = inventory + (pipeline if L > 0 else 0) <= r
+        orders += order
+        if i + L < n:
+            arrival = ring[(i + L) % (L + 1)]
+            placed = np.where(order, quantity, 0)
+            arrival += placed
+            pipeline += placed
+        pipeline -= ring[slot]
+        ring[slot] = 0
+
+        inventory -= demands[i]
+        held += np.maximum(inventory, 0)
+        short += np.maximum(-inventory, 0)
+
+    return (orders * float(K) + held * float(H) + short * float(S_cost)) / n
+
+
 class QRPolicy:
     """
     Implements a (Q, R) inventory policy and fits Q and R to minimize total cost.
@@ -44,52 +94,8 @@ class QRPolicy:
 
     @staticmethod
     def _simulate_cost_jit(demands, Q, R, K, H, S_cost, L):
-        """
-        Pure-Python / NumPy implementation of the original numba-compiled simulator.
-        Logic unchanged: arrivals are scheduled L periods after an order, reorder when
-        inventory + future arrivals <= R, and costs accumulated per period.
-        """
-        n = len(demands)
-        # integer arrays for arrivals; use int64 for safety on sums
-        arrivals = np.zeros(n, dtype=np.int64)
-        inv_level = int(R)
-        total_order_cost = 0.0
-        total_holding_cost = 0.0
-        total_stockout_cost = 0.0
-
-        # Iterate through periods (sequential dynamics require a loop)
-        for i in range(n):
-            # incorporate any arrivals that occur at this time
-            inv_level += int(arrivals[i])
-
-            # sum of arrivals in the next L-1 periods (i .. i+L-1) is the "future" arrival within lead time
-            # This mirrors the original logic: future_arrival = np.sum(arrivals[i:i + L])
-            if L > 0:
-                # slice is efficient in NumPy; cast sum to Python int
-                future_arrival = int(arrivals[i:i + L].sum())
-            else:
-                future_arrival = 0
-
-            # decide whether to place an order
-            if inv_level + future_arrival <= R:
-                if i + L < n:
-                    arrivals[i + L] += int(Q)
-                total_order_cost += float(K)
-
-            # serve demand
-            d = int(demands[i])
-            inv_level -= d
-
-            # holding and stockout calculation
-            hold = inv_level if inv_level > 0 else 0
-            short = -inv_level if inv_level < 0 else 0
-
-            total_stockout_cost += short * float(S_cost)
-            total_holding_cost += hold * float(H)
-
-        average_costs = (total_order_cost + total_holding_cost + total_stockout_cost) / n
-        # return float average cost (keeps monetary meaning; previous int truncation removed for accuracy)
-        return float(average_costs)
+        """Average cost per period of a single (Q, R) pair; see `_qr_costs`."""
+        return float(_qr_costs(demands, [Q], [R], K, H, S_cost, L)[0, 0])
 
     def _simulate_cost(self, demands: np.ndarray, Q: int = None, R: int = None) -> float:
         """
@@ -138,8 +144,41 @@ class QRPolicy:
         q_candidates = np.arange(1, int(eoq * 2) + 1)
         r_candidates = np.arange(1, int(eoq * 2) + 1)
         return q_candidates, r_candidates
-    
 
+    def _cost_grid(self, demands: np.ndarray, q_candidates: np.ndarray,
+                   r_candidates: np.ndarray, parallel: bool = False) -> np.ndarray:
+        """
+        Average cost of every (Q, R) candidate pair, shape (len(q), len(r)).
+
+        All R values of a Q slice share one vectorized pass over the history. With
+        `parallel` the Q slices are spread over a process pool; where processes are
+        unavailable (Pyodide) or there is a single CPU they run in this process.
+        """
+        costs = (self.config.order_cost, self.config.holding_cost,
+                 self.config.stockout_cost, self.config.lead_time)
+        # bound the per-pass state to ~1M candidates
+        block = max(1, (1 << 20) // max(len(r_candidates), 1))
+        slices = [q_candidates[i:i + block] for i in range(0, len(q_candidates), block)]
+
+        workers = os.cpu_count() or 1
+        if parallel and workers > 1 and len(q_candidates) > 1 and sys.platform != "emscripten":
+            from concurrent.futures import ProcessPoolExecutor
+            from concurrent.futures.process import BrokenProcessPool
+
+            # at least 4 parts per worker for balance, none larger than `block` rows
+            n_parts = max(min(len(q_candidates), 4 * workers), len(slices))
+            parts = [part for part in np.array_split(q_candidates, n_parts) if len(part)]
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(_qr_costs, demands, part, r_candidates, *costs)
+                        for part in parts
+                    ]
+                    return np.vstack([future.result() for future in futures])
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                pass  # no process support or a worker died: evaluate serially below
+
+        return np.vstack([_qr_costs(demands, part, r_candidates, *costs) for part in slices])
 
     def fit(self, history: pd.Series, q_candidates=None, r_candidates=None, parallel=False):
         """
@@ -149,7 +188,7 @@ class QRPolicy:
             history (pd.Series): Historical demand series.
             q_candidates (iterable, optional): Possible Q values.
             r_candidates (iterable, optional): Possible R values.
-            parallel (bool): Whether to run simulation in parallel.
+            parallel (bool): Whether to spread slices of Q candidates over worker processes.
 
         Returns:
             dict: Best parameters {'Q': Q, 'R': R, 'cost': total_cost}.
@@ -159,34 +198,29 @@ class QRPolicy:
 
         if q_candidates is None or r_candidates is None:
             q_candidates, r_candidates = self._generate_candidates(history)
-
-        best_cost = np.inf
-        best_Q = 0
-        best_R = 0
-
-
-        # The parallel flag previously used numba.prange; with a NumPy/Python simulator we
-        # revert to standard loops. The simulation itself uses NumPy arrays for numeric work.
-        for Q in q_candidates:
-            for R in r_candidates:
-                cost = self._simulate_cost(demands, Q, R)
-                if cost < best_cost:
-                    best_cost = cost
-                    best_Q = Q
-                    best_R = R
-        best_cost = int(round(best_cost, 0))
+        q_candidates = np.asarray(q_candidates)
+        r_candidates = np.asarray(r_candidates)
+
+        # first minimum in (Q, R) order, as in a nested loop over Q then R
+        grid = self._cost_grid(demands, q_candidates, r_candidates, parallel)
+        i, j = np.unravel_index(np.argmin(grid), grid.shape)
+        best_Q, best_R = q_candidates[i], r_candidates[j]
+        best_cost = int(round(grid[i, j], 0))
         self.params = {'Q': best_Q, 'R': best_R, 'avg_cost': best_cost, 'cost': best_cost * len(history)}
         return self
 
 
 class InventoryPlotter:
     def __init__(self, demand_df, config: InventoryConfig,
-                 date_col: str = "date", demand_col: str = "demand"):
+                 date_col: str = "date", demand_col: str = "demand",
+                 max_points: int = None):
         self.df = demand_df.copy()
         self.date_col = date_col
         self.demand_col = demand_col
         self.config = config
         self.sim_df = None
+        # point budget per line for the chart (LTTB downsampling); None plots every period
+        self.max_points = max_points
 
     def simulate_inventory(self, Q: int, R: int) -> pd.DataFrame:
         dates = self.df[self.date_col].values
@@ -226,11 +260,21 @@ class InventoryPlotter:
         return self.sim_df
 
     def plot(self, policy: "QRPolicy"):
+        import altair as alt
+
         self.simulate_inventory(policy.params['Q'], policy.params['R'])
         self.sim_df['Zero'] = 0.0
 
+        # keep stock-outs exact: the first and last period of every negative-inventory spell
+        negative = (self.sim_df['inventory_level'] < 0).astype(int).diff().fillna(0) != 0
+        sim_df = downsample(self.sim_df, self.date_col, [self.demand_col, 'inventory_level'],
+                            self.max_points, keep=self.sim_df.loc[negative, self.date_col])
+
+        # ship only the plotted columns once; the zero line is computed in the spec
+        builder = SharedDataChart(sim_df, columns=[self.date_col, self.demand_col, 'inventory_level'])
         base = (
-            alt.Chart(self.sim_df)
+            builder.base()
+            .transform_calculate(Zero='0')
             .transform_fold([self.demand_col, 'inventory_level', 'Zero'], as_=['Metric', 'Value'])
             .transform_calculate(
                 colorCategory=(
@@ -278,7 +322,7 @@ class InventoryPlotter:
         params_text = f"Q={policy.params['Q']}, R={policy.params['R']}"
 
         return (
-            alt.layer(lines, points)
+            builder.add(lines, points).build()
             .properties(title=f'QR-Policy ({params_text}, Avg. Cost: {policy.params["avg_cost"]}, Total Cost: {policy.params["cost"]})',
                         width=800, height=400)
             .resolve_scale(y='independent')
@@ -320,6 +364,8 @@ class QRForecasting(QRPolicy):
             critical_ratio = self.config.stockout_cost / (self.config.stockout_cost + self.config.holding_cost)
             
             # Safety stock using normal distribution
+            from scipy.stats import norm
+
             safety_stock = norm.ppf(critical_ratio) * forecast_std * np.sqrt(self.config.lead_time)
             
             # Reorder point = expected demand during lead time + safety stock
@@ -359,12 +405,14 @@ class SimpleForecastPlotter:
                     forecast: pd.DataFrame = pd.DataFrame(),
                     date_col: str = "date",
                     actual_col: str = "demand",
-                    forecast_col: str = "forecast"):
+                    forecast_col: str = "forecast",
+                    max_points: int = None):
         self.history = history.copy()
         self.forecast = forecast.copy()
         self.date_col = date_col
         self.actual_col = actual_col
         self.forecast_col = forecast_col
+        self.max_points = max_points
         self.mae_ = None
         self.mape_ = None
         
@@ -381,11 +429,15 @@ class SimpleForecastPlotter:
             self.mae_ = np.mean(np.abs(actuals_in_forecast - forecast_values))
             self.mape_ = np.mean(np.abs((actuals_in_forecast - forecast_values) / actuals_in_forecast)) * 100
 
-    def plot(self, title: str = "Forecast vs Actuals", model_col: str = "Model") -> alt.Chart:
-        """Create a simple forecast plot with metrics."""
-        
+    def plot(self, title: str = "Forecast vs Actuals", model_col: str = "Model") -> "alt.Chart":
+        """Create a simple forecast plot with metrics (LTTB-downsampled to `max_points` per line if set)."""
+        import altair as alt
+
+        keep = [self.forecast[self.date_col].min()] if not self.forecast.empty else None
+        history = downsample(self.history, self.date_col, [self.actual_col], self.max_points, keep=keep)
+
         # Historical data
-        hist_chart = alt.Chart(self.history).mark_line(
+        hist_chart = alt.Chart(history).mark_line(
             point=True, color='steelblue'
         ).encode(
             x=alt.X(f'{self.date_col}:T', title='Date'),
@@ -400,7 +452,8 @@ class SimpleForecastPlotter:
 
             self._calculate_metrics()
 
-            forecast_chart = alt.Chart(self.forecast).mark_line(
+            forecast = downsample(self.forecast, self.date_col, [self.forecast_col], self.max_points)
+            forecast_chart = alt.Chart(forecast).mark_line(
                 point=False, color='orange', strokeDash=[5, 5]
             ).encode(
                 x=alt.X(f'{self.date_col}:T'),
@@ -453,7 +506,7 @@ class SafetyStockPlotter:
                 use_sample_stats: bool = True,
                 mean_daily: float = None,
                 std_daily: float = None,
-                points: int = 500) -> alt.Chart:
+                points: int = 500) -> "alt.Chart":
         """
         Create an Altair chart of the Normal(D_L) density with safety stock and R marked.
 
@@ -468,6 +521,9 @@ class SafetyStockPlotter:
         Returns:
             alt.Chart: layered chart showing density, mu, R and annotations.
         """
+        import altair as alt
+        from scipy.stats import norm
+
         if use_sample_stats:
             series = self.history[self.demand_col].values.astype(float)
             mean_daily = float(np.mean(series))
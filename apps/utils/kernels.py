@@ -0,0 +1,219 @@
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple
+
+# Smoothing and trend kernels shared by the forecasting utilities. Everything works on
+# plain NumPy arrays; the time recursions are compiled with numba when it is installed
+# (never in Pyodide), otherwise they run as NumPy-vectorized Python loops.
+
+_COMPILED: Dict[Callable, Callable] = {}
+
+
+def _compiled(fn: Callable) -> Callable:
+    """numba-compiled `fn` if numba is available, else `fn` itself; resolved once per function."""
+    if fn not in _COMPILED:
+        try:
+            from numba import njit
+        except ImportError:
+            _COMPILED[fn] = fn
+        else:
+            _COMPILED[fn] = njit(cache=True)(fn)
+    return _COMPILED[fn]
+
+
+def linear_trend(y: np.ndarray) -> Tuple[float, float]:
+    """Closed-form least-squares intercept and slope of `y` on 0..n-1."""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    x = np.arange(n, dtype=float)
+    x_mean = (n - 1) / 2
+    y_mean = y.mean()
+    sxx = np.sum((x - x_mean) ** 2)
+    slope = np.sum((x - x_mean) * (y - y_mean)) / sxx if sxx > 0 else 0.0
+    return y_mean - slope * x_mean, slope
+
+
+def prefix_slopes(y: np.ndarray) -> np.ndarray:
+    """Least-squares slope of every prefix y[:k] on 0..k-1 from running sums (NaN for k < 2)."""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    k = np.arange(1, n + 1, dtype=float)
+    x = np.arange(n, dtype=float)
+    sx, sy = np.cumsum(x), np.cumsum(y)
+    sxx, sxy = np.cumsum(x * x), np.cumsum(x * y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (sxy - sx * sy / k) / (sxx - sx * sx / k)
+
+
+def moving_average(y: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """
+    Trailing means of `y` for every window size at once via a cumulative sum.
+
+    Returns an array of shape (len(windows), len(y)) where entry [i, t] is the mean
+    of y[t - windows[i] + 1 : t + 1], or NaN while fewer than windows[i] values exist.
+    """
+    windows = np.asarray(windows, dtype=int)
+    n = len(y)
+    csum = np.concatenate([[0.0], np.cumsum(y, dtype=float)])
+    end = np.arange(1, n + 1)
+    start = end[None, :] - windows[:, None]
+    valid = start >= 0
+    out = (csum[end][None, :] - csum[np.where(valid, start, 0)]) / windows[:, None]
+    return np.where(valid, out, np.nan)
+
+
+def ses(y: np.ndarray, alphas: np.ndarray, block: int = 64) -> np.ndarray:
+    """
+    Simple exponential smoothing levels of `y` for every alpha at once.
+
+    The level starts at y[0] and follows L_t = alpha * y_t + (1 - alpha) * L_{t-1}
+    (the StatsForecast convention). Within blocks of `block` steps the recursion is
+    written as a lower-triangular EWMA weight matrix per alpha, so each block is a
+    single matrix product plus the decayed level carried over from the previous block.
+
+    Returns an array of shape (len(alphas), len(y)).
+    """
+    alphas = np.asarray(alphas, dtype=float)
+    n = len(y)
+    out = np.empty((len(alphas), n))
+    if n == 0:
+        return out
+
+    # W[a, j, i] = alpha * (1 - alpha)^(j - i) for i <= j, decay[a, j] = (1 - alpha)^(j + 1)
+    lag = np.arange(block)[:, None] - np.arange(block)[None, :]
+    keep = 1 - alphas[:, None, None]
+    weights = np.where(lag >= 0, alphas[:, None, None] * keep ** np.maximum(lag, 0), 0.0)
+    decay = keep[:, :, 0] ** np.arange(1, block + 1)
+
+    level = np.full(len(alphas), float(y[0]))
+    for start in range(0, n, block):
+        chunk = np.asarray(y[start:start + block], dtype=float)
+        b = len(chunk)
+        out[:, start:start + b] = weights[:, :b, :b] @ chunk + decay[:, :b] * level[:, None]
+        level = out[:, start + b - 1]
+    return out
+
+
+def _holt_loop(y, alpha, beta, level, trend):
+    for t in range(1, len(y)):
+        level[t] = alpha * y[t] + (1 - alpha) * (level[t - 1] + trend[t - 1])
+        trend[t] = beta * (level[t] - level[t - 1]) + (1 - beta) * trend[t - 1]
+
+
+def holt(y: np.ndarray, alpha: float, beta: float, level0: float,
+         trend0: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Holt's linear trend recursion started from (level0, trend0) at t = 0.
+
+    L_t = alpha * y_t + (1 - alpha) * (L_{t-1} + b_{t-1})
+    b_t = beta * (L_t - L_{t-1}) + (1 - beta) * b_{t-1}
+
+    Returns the level and trend arrays, each of length len(y).
+    """
+    y = np.asarray(y, dtype=float)
+    level = np.empty(len(y))
+    trend = np.empty(len(y))
+    if len(y) == 0:
+        return level, trend
+    level[0], trend[0] = level0, trend0
+    _compiled(_holt_loop)(y, float(alpha), float(beta), level, trend)
+    return level, trend
+
+
+def _holt_winters_loop(y, m, alpha, beta, gamma, level, trend, seasonal, forecast):
+    for t in range(1, len(y)):
+        seasonal_prev = seasonal[:, t - m] if t >= m else seasonal[:, t]
+        base = level[:, t - 1] + trend[:, t - 1]
+        forecast[:, t] = base + seasonal_prev
+        level[:, t] = alpha * (y[t] - seasonal_prev) + (1 - alpha) * base
+        trend[:, t] = beta * (level[:, t] - level[:, t - 1]) + (1 - beta) * trend[:, t - 1]
+        seasonal[:, t] = gamma * (y[t] - level[:, t - 1] - trend[:, t - 1]) + (1 - gamma) * seasonal_prev
+
+
+def holt_winters_additive(y: np.ndarray, m: int, alpha: np.ndarray, beta: np.ndarray,
+                          gamma: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Additive Holt-Winters recursion for P parameter triples at once.
+
+    The level starts at the mean of the first season, the trend at the least-squares
+    slope of the first two seasons and the seasonal indices at the first season's
+    deviations from that level.
+
+    Returns level, trend, seasonal and in-sample one-step forecast arrays of shape (P, n);
+    the forecast is 0 at t = 0.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    alpha = np.atleast_1d(np.asarray(alpha, dtype=float))
+    beta = np.atleast_1d(np.asarray(beta, dtype=float))
+    gamma = np.atleast_1d(np.asarray(gamma, dtype=float))
+    p = len(alpha)
+    level = np.zeros((p, n))
+    trend = np.zeros((p, n))
+    seasonal = np.zeros((p, n))
+    forecast = np.zeros((p, n))
+
+    init_level = y[:m].mean()
+    init_trend = linear_trend(y[:2 * m])[1]
+    level[:, 0], trend[:, 0] = init_level, init_trend
+    seasonal[:, :m] = y[:m] - init_level
+
+    _compiled(_holt_winters_loop)(y, m, alpha, beta, gamma, level, trend, seasonal, forecast)
+    return level, trend, seasonal, forecast
+
+
+def intermittent(y: np.ndarray, alpha_d: np.ndarray, alpha_p: np.ndarray,
+                 state: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+    """
+    Croston / TSB recursions for a padded panel of series and K parameter pairs at once.
+
+    `y` has shape (S, T); NaN entries are padding and skipped, so series of different
+    lengths can share one array. Every column is one vectorized update over all series:
+    the non-zero demand size and the interval between non-zero demands (Croston) are
+    smoothed with alpha_d in periods with demand, the probability of a non-zero demand
+    (TSB) with alpha_p in every observed period. Each level starts at its first value
+    (the StatsForecast convention). Passing the returned `state` back in continues the
+    recursion with further columns.
+
+    Returns a dict with 'size', 'interval' and 'probability' of shape (K, S) (NaN until
+    defined) and per-series 'since' (observed periods since the last demand) and
+    'observed' (whether any period was seen).
+    """
+    y = np.asarray(y, dtype=float)
+    alpha_d = np.asarray(alpha_d, dtype=float)[:, None]
+    alpha_p = np.asarray(alpha_p, dtype=float)[:, None]
+    if state is None:
+        shape = (len(alpha_d), y.shape[0])
+        state = {
+            "size": np.full(shape, np.nan),
+            "interval": np.full(shape, np.nan),
+            "probability": np.full(shape, np.nan),
+            "since": np.zeros(y.shape[0]),
+            "observed": np.zeros(y.shape[0], dtype=bool),
+        }
+    size, interval, probability = state["size"], state["interval"], state["probability"]
+    since, observed = state["since"], state["observed"]
+
+    # dense masked updates (np.where) over all series per column; padding leaves state as is
+    for values in y.T:
+        valid = ~np.isnan(values)
+        demand = valid & (values > 0)
+        since = since + valid
+
+        smoothed = probability + alpha_p * (demand - probability)
+        probability = np.where(valid & ~observed, demand, np.where(valid, smoothed, probability))
+        observed = observed | valid
+
+        first = demand & np.isnan(size[0])
+        size = np.where(first, values, np.where(demand, size + alpha_d * (values - size), size))
+        interval = np.where(
+            first, since, np.where(demand, interval + alpha_d * (since - interval), interval)
+        )
+        since = np.where(demand, 0.0, since)
+
+    return {
+        "size": size,
+        "interval": interval,
+        "probability": probability,
+        "since": since,
+        "observed": observed,
+    }
@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Sequence
+from .kernels import moving_average, ses
+
+
+class SmoothingSweep:
+    """
+    Rolling-origin moving-average and SES forecasts for whole vectors of q / alpha values.
+
+    The result has the layout of the StatsForecast cross-validation artifacts
+    (['unique_id', 'date', 'cutoff', 'demand', <aliases>]) and can be passed to
+    `ForecastPlotter.add_forecast` / `add_historic_forecast` and `Evaluator` directly.
+    """
+
+    def __init__(
+        self,
+        date_col: str = "date",
+        actual_col: str = "demand",
+        unique_id_col: str = "unique_id",
+        cutoff_col: str = "cutoff",
+    ):
+        self.date_col = date_col
+        self.actual_col = actual_col
+        self.unique_id_col = unique_id_col
+        self.cutoff_col = cutoff_col
+
+    @staticmethod
+    def ma_alias(q: int) -> str:
+        return f"MA_{q}"
+
+    @staticmethod
+    def ses_alias(alpha: float) -> str:
+        return f"SES_{alpha:g}"
+
+    def _origins(self, dates: np.ndarray, h: int, cutoffs, n_windows, step_size) -> np.ndarray:
+        """Positional index of the last observation at or before each cutoff."""
+        if cutoffs is not None:
+            cutoffs = pd.to_datetime(pd.Index(cutoffs)).values
+            return np.searchsorted(dates, cutoffs, side="right") - 1
+        if n_windows is None:
+            raise ValueError("Provide either cutoffs or n_windows.")
+        step_size = step_size or h
+        last = len(dates) - h - 1
+        return last - step_size * np.arange(n_windows - 1, -1, -1)
+
+    def cross_validation(
+        self,
+        df: pd.DataFrame,
+        h: int,
+        cutoffs: Optional[Sequence] = None,
+        n_windows: Optional[int] = None,
+        step_size: Optional[int] = None,
+        ma_windows: Sequence[int] = (),
+        ses_alphas: Sequence[float] = (),
+        ma_aliases: Optional[List[str]] = None,
+        ses_aliases: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Forecast `h` steps ahead from every cutoff for all q / alpha values in one pass.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Long-format history with columns ['unique_id', 'date', 'demand'].
+        h : int
+            Forecast horizon (number of periods after each cutoff).
+        cutoffs : sequence of dates, optional
+            Forecast origins. Each uses all observations up to and including the date.
+        n_windows, step_size : int, optional
+            StatsForecast-style windows counted back from the end of each series,
+            used when `cutoffs` is not given. `step_size` defaults to `h`.
+        ma_windows : sequence of int
+            Moving-average window sizes q.
+        ses_alphas : sequence of float
+            SES smoothing factors.
+        ma_aliases, ses_aliases : list of str, optional
+            Column names; default to 'MA_{q}' and 'SES_{alpha}'. Must be unique.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per (series, cutoff, step) with a forecast column per alias.
+        """
+        ma_windows = np.asarray(ma_windows, dtype=int)
+        ses_alphas = np.asarray(ses_alphas, dtype=float)
+        aliases = (ma_aliases or [self.ma_alias(q) for q in ma_windows]) + (
+            ses_aliases or [self.ses_alias(a) for a in ses_alphas]
+        )
+        if len(aliases) != len(ma_windows) + len(ses_alphas):
+            raise ValueError("Number of aliases must match the number of q / alpha values.")
+        if len(set(aliases)) != len(aliases):
+            raise ValueError("Aliases must be unique; got duplicates for different q / alpha values.")
+
+        df = df.sort_values([self.unique_id_col, self.date_col])
+        frames = []
+        for uid, series in df.groupby(self.unique_id_col, sort=False, observed=True):
+            dates = pd.to_datetime(series[self.date_col]).values
+            y = series[self.actual_col].values.astype(float)
+
+            origins = self._origins(dates, h, cutoffs, n_windows, step_size)
+            origins = origins[(origins >= 0) & (origins < len(y) - 1)]
+            if len(origins) == 0:
+                continue
+
+            # (models, time) forecasts made at every origin
+            fitted = np.vstack([moving_average(y, ma_windows), ses(y, ses_alphas)])
+
+            # target rows: up to h observations after each origin
+            steps = np.arange(1, h + 1)
+            rows = origins[:, None] + steps[None, :]
+            keep = rows < len(y)
+            target = rows[keep]
+            origin = np.broadcast_to(origins[:, None], rows.shape)[keep]
+
+            frame = pd.DataFrame({
+                self.unique_id_col: uid,
+                self.date_col: dates[target],
+                self.cutoff_col: dates[origin],
+                self.actual_col: y[target],
+            })
+            values = pd.DataFrame(fitted[:, origin].T, columns=aliases, index=frame.index)
+            frames.append(pd.concat([frame, values], axis=1))
+
+        if not frames:
+            return pd.DataFrame(columns=[self.unique_id_col, self.date_col, self.cutoff_col, self.actual_col] + aliases)
+        return pd.concat(frames, ignore_index=True)
+
+    def update_forecast(self, forecast: pd.DataFrame, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+        """
+        Recompute MA / SES columns of an existing cross-validation frame on its own cutoffs.
+
+        Columns produced by the sweep replace same-named columns of `forecast` in place
+        (new ones are appended); all other model columns (e.g. Holt, Holt-Winters) and the
+        `unique_id` dtype are kept.
+        """
+        cutoffs = pd.to_datetime(forecast[self.cutoff_col]).unique()
+        h = int(forecast.groupby([self.unique_id_col, self.cutoff_col], observed=True).size().max())
+        sweep = self.cross_validation(df, h=h, cutoffs=cutoffs, **kwargs)
+        keys = [self.unique_id_col, self.date_col, self.cutoff_col]
+        model_cols = [c for c in sweep.columns if c not in keys + [self.actual_col]]
+        base = forecast.drop(columns=[c for c in model_cols if c in forecast.columns])
+        base[self.cutoff_col] = pd.to_datetime(base[self.cutoff_col])
+        result = base.merge(sweep[keys + model_cols], on=keys, how="left")
+        uid = self.unique_id_col
+        result[uid] = result[uid].astype(forecast[uid].dtype)
+        return result[forecast.columns.union(model_cols, sort=False)]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from io import BytesIO
+from typing import Dict, List, Optional
+
+# Public entry points of the utils package used by the marimo apps
+ENTRY_POINTS: Dict[str, List[str]] = {
+    "utils.data": [
+        "DataLoader", "DataSplitter", "RollingOriginSplitter", "DataSimulator", "PanelSimulator",
+    ],
+    "utils.slides": ["SlideCreator"],
+    "utils.forecast": [
+        "DemandForecaster",
+        "Evaluator",
+        "ForecastLoader",
+        "ForecastPlotter",
+        "HoltWintersPlotter",
+        "TimeSeriesDecompositionPlotter",
+    ],
+    "utils.inventory": ["QRPolicy", "InventoryPlotter", "SafetyStockPlotter"],
+    "utils.sweep": ["SmoothingSweep"],
+    "utils.mrp": ["MRPLogic"],
+}
+
+# Dependencies whose import dominates cold start in the WASM builds
+HEAVY_MODULES = [
+    "altair",
+    "marimo",
+    "pyarrow",
+    "scipy",
+    "statsforecast",
+    "statsmodels",
+    "utilsforecast",
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from {module} import {name}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def measure(root: str, module: str, name: str, repeat: int) -> Optional[dict]:
+    """Median import time of `from module import name` in fresh interpreters rooted at `root`."""
+    code = PROBE.format(module=module, name=name, heavy=HEAVY_MODULES)
+    timings, loaded = [], []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            return None
+        probe = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(probe["seconds"])
+        loaded = probe["loaded"]
+    return {"ms": 1000 * statistics.median(timings), "loaded": loaded}
+
+
+def checkout_utils(revision: str, destination: str) -> str:
+    """Extract apps/utils at a git revision into `destination`; returns the new apps root."""
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", revision, "apps/utils"],
+        capture_output=True, check=True,
+    ).stdout
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        tar.extractall(destination)
+    return os.path.join(destination, "apps")
+
+
+def run(root: str, baseline_root: Optional[str], repeat: int) -> None:
+    header = f"{'entry point':48} {'current':>10}"
+    if baseline_root:
+        header += f" {'baseline':>10} {'saved':>8}"
+    print(header + "  heavy modules loaded")
+
+    for module, names in ENTRY_POINTS.items():
+        for name in names:
+            current = measure(root, module, name, repeat)
+            if current is None:
+                print(f"{module}.{name:<{47 - len(module)}} import failed")
+                continue
+            line = f"{module + '.' + name:48} {current['ms']:8.0f}ms"
+            if baseline_root:
+                baseline = measure(baseline_root, module, name, repeat)
+                if baseline is None:
+                    line += f" {'n/a':>10} {'':>8}"
+                else:
+                    line += f" {baseline['ms']:8.0f}ms {baseline['ms'] - current['ms']:6.0f}ms"
+            print(f"{line}  {', '.join(current['loaded']) or '-'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure cold import time of the public utils entry points."
+    )
+    parser.add_argument(
+        "--root", default="apps",
+        help="Directory containing the utils package (default: apps)",
+    )
+    parser.add_argument(
+        "--baseline", default=None,
+        help="Git revision to compare against, e.g. HEAD~1",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5,
+        help="Fresh interpreters per entry point; the median is reported (default: 5)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_root = checkout_utils(args.baseline, tmp) if args.baseline else None
+        run(args.root, baseline_root, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
-import random
 import datetime
 
+import numpy as np
+
 
 class DemandGenerator:
-    def __init__(self, start_date, end_date, dc_count=16):
+    def __init__(self, start_date, end_date, dc_count=16, seed=None, scenario=0):
         self.start = datetime.date.fromisoformat(start_date)
         self.end = datetime.date.fromisoformat(end_date)
         self.dc_count = dc_count
@@ -11,17 +12,30 @@ class DemandGenerator:
             (self.start + datetime.timedelta(days=i)).isoformat()
             for i in range((self.end - self.start).days + 1)
         ]
+        # Root entropy of the run; every (scenario, DC) pair gets its own child stream,
+        # so DCs can be generated in separate processes and match a serial run
+        self.entropy = np.random.SeedSequence(seed).entropy
+        self.scenario = scenario
+
+    def _stream(self, dc):
+        return np.random.default_rng(
+            np.random.SeedSequence(self.entropy, spawn_key=(self.scenario, dc))
+        )
+
+    def generate_dc(self, dc):
+        """CSV lines "DC,Date,Demand" of one DC (numbered from 1)."""
+        rng = self._stream(dc)
+        base_avg = rng.integers(30, 70, endpoint=True)
+        noise = rng.integers(-15, 15, size=len(self.dates), endpoint=True)
+        demand = np.maximum(0, base_avg + noise)
+        return [f"DC{dc},{date},{value}" for date, value in zip(self.dates, demand)]
 
     def generate(self):
         lines = []
         # Header for easier pandas parsing later
         lines.append("DC,Date,Demand")
         for dc in range(1, self.dc_count + 1):
-            base_avg = random.randint(30, 70)
-            for date in self.dates:
-                noise = random.randint(-15, 15)
-                demand = max(0, base_avg + noise)
-                lines.append(f"DC{dc},{date},{demand}")
+            lines.extend(self.generate_dc(dc))
         return lines
 
 # --- 2. The Policy Calculator ---
@@ -1,29 +1,42 @@
 import os
+import json
 import numpy as np
 import pandas as pd
-from typing import Dict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
 from typing_extensions import Literal
 
 
+def stream(seed: int, *key: int) -> np.random.Generator:
+    """
+    Independent random generator for one (scenario, series, DC, ...) key of a run.
+
+    Streams are child SeedSequences addressed by their key instead of by spawn
+    order, so any subset of series can be generated in any process and in any
+    order and still draws exactly what a serial run draws.
+    """
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=key))
+
+
 class DataSimulator:
     """Simulates weekly demand data with realistic trend, pronounced seasonality,
     holiday effects, and heteroskedastic noise. Generates data from start_date to end_date.
     """
 
-    def __init__(self, start_date: str, end_date: str, seed: int = 42):
+    def __init__(self, start_date: str, end_date: str, seed: int = 42, scenario: int = 0):
         """
         Args:
             start_date (str): Simulation start date in ISO format (e.g., '2020-01-01').
             end_date (str): Simulation end date in ISO format (e.g., '2025-01-01').
             seed (int): Random seed for reproducibility.
+            scenario (int): Scenario number; each scenario draws from its own streams.
         """
         self.start_date = pd.to_datetime(start_date)
         self.end_date = pd.to_datetime(end_date)
         self.dates = pd.date_range(start=self.start_date, end=self.end_date, freq="W")
         self.periods = len(self.dates)
-
-
-        np.random.seed(seed)
+        self.seed = seed
+        self.scenario = scenario
 
     def _simulate_weekly_demand(self) -> pd.Series:
         t = np.arange(self.periods)
@@ -56,7 +69,7 @@ class DataSimulator:
         seasonal = amplitude_per_week * np.cos(2 * np.pi * (t - 1) / 52)
 
         # 3. Homoscedastic Noise (constant variance)
-        noise = np.random.normal(0, 25, self.periods)  
+        noise = stream(self.seed, self.scenario, 0).normal(0, 25, self.periods)
         
         # 4. Combine components and scale
         demand = base + trend + seasonal + noise + holiday_effect + summer_dip
@@ -72,30 +85,22 @@ class DataSimulator:
     def _simulate_daily_demand(self) -> pd.DataFrame:
         weekly_df = self._simulate_weekly_demand()
 
-        daily_records = []
-
-        for _, row in weekly_df.iterrows():
-            week_start = row["date"] - pd.Timedelta(days=6)
-            week_demand = row["demand"]
+        # Draw 7 uniform samples per week and convert them to weekday proportions
+        week_day_proportions = stream(self.seed, self.scenario, 1).uniform(0.1, 0.3, (len(weekly_df), 7))
+        week_day_proportions /= week_day_proportions.sum(axis=1, keepdims=True)
 
-            # Draw 7 samples from a uniform distribution and convert to proportions
-            week_day_proportions = np.random.uniform(0.1, 0.3, 7)
-            week_day_proportions /= week_day_proportions.sum()  # Normalize to sum
+        # Calculate daily demand based on proportions
+        daily_demand = (weekly_df["demand"].values[:, None] * week_day_proportions).round().astype(int)
+        week_start = weekly_df["date"].values - np.timedelta64(6, "D")
+        daily_dates = week_start[:, None] + np.arange(7) * np.timedelta64(1, "D")
 
-            # Calculate daily demand based on proportions
-            daily_demand = (week_demand * week_day_proportions).round().astype(int)
-
-            for i in range(7):
-                daily_date = week_start + pd.Timedelta(days=i)
-                if daily_date < self.start_date or daily_date > self.end_date:
-                    continue
-                daily_records.append({
-                    "unique_id": "Demand Amoxicillin Fürth",
-                    "date": daily_date,
-                    "demand": daily_demand[i]
-                })
-
-        return pd.DataFrame(daily_records)
+        daily_df = pd.DataFrame({
+            "unique_id": "Demand Amoxicillin Fürth",
+            "date": daily_dates.ravel(),
+            "demand": daily_demand.ravel(),
+        })
+        in_range = (daily_df["date"] >= self.start_date) & (daily_df["date"] <= self.end_date)
+        return daily_df[in_range].reset_index(drop=True)
 
 
     def simulate(self, freq: Literal['weekly', 'daily'] = 'weekly') -> pd.DataFrame:
@@ -111,28 +116,293 @@ class DataSimulator:
         return df[["unique_id", "date", "demand"]]
 
 
+class PanelSimulator:
+    """Simulates daily demand for n_skus x n_dcs series with the components of
+    DataSimulator (trend, yearly seasonality, holiday / summer effects, noise and
+    random weekday splits), drawn per SKU and scaled per DC.
+
+    Series are generated in chunks as whole (series, week, weekday) arrays, so
+    `iter_chunks` and `to_parquet` run with memory bounded by the chunk size
+    regardless of the panel size. Every series draws its noise from its own
+    `stream(seed, scenario, 1, sku, dc)`, so the output does not depend on the
+    chunk size or on how many worker processes generate it.
+    """
+
+    def __init__(self, start_date: str, end_date: str, n_skus: int = 100,
+                 n_dcs: int = 5, seed: int = 42, scenario: int = 0):
+        """
+        Args:
+            start_date (str): First simulated day in ISO format (e.g., '2020-01-01').
+            end_date (str): Last simulated day in ISO format (e.g., '2025-01-01').
+            n_skus (int): Number of products.
+            n_dcs (int): Number of distribution centers stocking every product.
+            seed (int): Random seed for reproducibility.
+            scenario (int): Scenario number; each scenario draws from its own streams.
+        """
+        self.start_date = pd.to_datetime(start_date)
+        self.end_date = pd.to_datetime(end_date)
+        self.n_skus = n_skus
+        self.n_dcs = n_dcs
+        self.seed = seed
+        self.scenario = scenario
+
+        # weeks (ending Sunday) covering every simulated day
+        self.weeks = pd.date_range(self.start_date, self.end_date + pd.Timedelta(days=6), freq="W")
+        days = self.weeks.values[:, None] - np.arange(6, -1, -1) * np.timedelta64(1, "D")
+        self.days = days.ravel()
+        self.in_range = (self.days >= self.start_date.to_datetime64()) & (
+            self.days <= self.end_date.to_datetime64()
+        )
+
+        # Per-SKU level, yearly trend, seasonal amplitude / phase and noise; per-DC scale
+        rng = stream(seed, scenario, 0)
+        self.base = rng.lognormal(np.log(40), 1.0, n_skus)
+        self.trend = rng.normal(0.05, 0.1, n_skus)
+        self.amplitude = rng.uniform(0.0, 0.3, n_skus)
+        self.phase = rng.uniform(0, 52, n_skus)
+        self.noise = rng.uniform(0.05, 0.15, n_skus)
+        self.dc_scale = rng.lognormal(0.0, 0.5, n_dcs)
+
+        # Calendar effects relative to the level, as in DataSimulator (+15 / -10 on 300)
+        week_of_year = self.weeks.isocalendar().week.values
+        self.calendar = (
+            1
+            + np.where((week_of_year >= 51) | (week_of_year <= 1), 0.05, 0.0)
+            + np.where((week_of_year >= 28) & (week_of_year <= 32), -1 / 30, 0.0)
+        )
+
+    @property
+    def n_series(self) -> int:
+        return self.n_skus * self.n_dcs
+
+    def _simulate_chunk(self, series: np.ndarray) -> pd.DataFrame:
+        """Daily demand for the series indices `series` (SKU-major: series = sku * n_dcs + dc)."""
+        sku, dc = np.divmod(series, self.n_dcs)
+        t = np.arange(len(self.weeks))
+
+        # per-series streams: weekly noise and weekday proportions
+        shocks = np.empty((len(series), len(t)))
+        proportions = np.empty((len(series), len(t), 7))
+        for row, (s, d) in enumerate(zip(sku, dc)):
+            rng = stream(self.seed, self.scenario, 1, int(s), int(d))
+            shocks[row] = rng.standard_normal(len(t))
+            proportions[row] = rng.uniform(0.1, 0.3, (len(t), 7))
+
+        # (series, week) weekly demand from multiplicative components
+        level = (self.base[sku] * self.dc_scale[dc])[:, None]
+        trend = np.maximum(1 + self.trend[sku, None] * t / 52, 0.1)
+        seasonal = 1 + self.amplitude[sku, None] * np.cos(2 * np.pi * (t - self.phase[sku, None]) / 52)
+        noise = 1 + self.noise[sku, None] * shocks
+        weekly = np.maximum(level * trend * seasonal * self.calendar * noise, 0)
+
+        # (series, week, weekday) split with random weekday proportions
+        proportions /= proportions.sum(axis=2, keepdims=True)
+        daily = (weekly[:, :, None] * proportions).round().reshape(len(series), -1)
+        daily = daily[:, self.in_range].astype(np.int32)
+
+        n_days = daily.shape[1]
+        labels = np.char.add(
+            np.char.add("SKU", np.char.zfill(sku.astype(str), 5)),
+            np.char.add("-DC", np.char.zfill(dc.astype(str), 3)),
+        )
+        return pd.DataFrame({
+            "unique_id": pd.Categorical.from_codes(np.repeat(np.arange(len(series)), n_days), labels),
+            "sku": np.repeat(sku.astype(np.int32), n_days),
+            "dc": np.repeat(dc.astype(np.int32), n_days),
+            "date": np.tile(self.days[self.in_range], len(series)),
+            "demand": daily.ravel(),
+        })
+
+    def iter_chunks(self, chunk_series: int = 1000,
+                    max_workers: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield the panel as DataFrames of `chunk_series` consecutive series each, in order.
+
+        With `max_workers` the chunks are generated in a process pool (at most two per
+        worker in flight); the output is identical to a serial run.
+        """
+        chunks = [
+            np.arange(start, min(start + chunk_series, self.n_series))
+            for start in range(0, self.n_series, chunk_series)
+        ]
+        if not max_workers:
+            for series in chunks:
+                yield self._simulate_chunk(series)
+            return
+
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            pending = deque()
+            for series in chunks:
+                pending.append(pool.submit(self._simulate_chunk, series))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def simulate(self, chunk_series: int = 1000, max_workers: Optional[int] = None) -> pd.DataFrame:
+        """The whole panel as one DataFrame with columns ['unique_id', 'sku', 'dc', 'date', 'demand']."""
+        from pandas.api.types import union_categoricals
+
+        chunks = list(self.iter_chunks(chunk_series, max_workers))
+        # each chunk carries only its own labels; concat would fall back to object dtype
+        unique_id = union_categoricals([chunk["unique_id"] for chunk in chunks])
+        df = pd.concat([chunk.drop(columns="unique_id") for chunk in chunks], ignore_index=True)
+        df.insert(0, "unique_id", unique_id)
+        return df
+
+    def to_parquet(self, path: str, chunk_series: int = 1000,
+                   compression: Optional[str] = "snappy",
+                   max_workers: Optional[int] = None) -> int:
+        """
+        Stream the panel to a Parquet file, one row group per chunk of series.
+
+        Returns
+        -------
+        int
+            Number of rows written.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # fixed schema: the dictionary index width would otherwise vary with the chunk size
+        schema = pa.schema([
+            ("unique_id", pa.dictionary(pa.int32(), pa.string())),
+            ("sku", pa.int32()),
+            ("dc", pa.int32()),
+            ("date", pa.timestamp("ns")),
+            ("demand", pa.int32()),
+        ])
+        rows = 0
+        with pq.ParquetWriter(path, schema, compression=compression) as writer:
+            for chunk in self.iter_chunks(chunk_series, max_workers):
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                writer.write_table(table, row_group_size=len(chunk))
+                rows += len(chunk)
+        return rows
+
+
 class DataLoader:
-    """Loads and prepares data for forecasting."""
+    """Loads and prepares data for forecasting.
+
+    Demand CSVs are parsed with a fixed schema: `unique_id` as categorical, `date` as
+    datetime64 and integer `demand` as int32 (int64 only if needed), using the pyarrow
+    CSV engine when it is installed. For local files the typed frame is also written
+    to a Parquet sidecar (`.<name>.parquet` next to the CSV) together with the CSV's
+    modification time, size and SHA-256; later loads read the sidecar while the
+    modification time is unchanged, or while the content hash still matches.
+    """
+
+    SIDECAR_KEY = b"om_lecture.source"
+    # bumped whenever the parsed schema changes, so older sidecars are rewritten
+    SIDECAR_VERSION = 2
 
     def __init__(
         self,
+        use_cache: bool = True,
     ) -> None:
-        pass
+        self.use_cache = use_cache
+
+    @staticmethod
+    def _sidecar_path(file_path: str) -> str:
+        folder, name = os.path.split(file_path)
+        return os.path.join(folder, f".{name}.parquet")
+
+    @staticmethod
+    def _file_hash(file_path: str) -> str:
+        import hashlib
+
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _read_csv(self, file_path: str) -> pd.DataFrame:
+        """Parse the CSV with the demand schema; a leading unnamed index column is dropped."""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            df = pd.read_csv(file_path, dtype={"unique_id": "category"}, parse_dates=["date"])
+        else:
+            # typed conversion inside pyarrow; parse_dates would re-parse in pandas
+            df = pd.read_csv(
+                file_path,
+                engine="pyarrow",
+                dtype={"unique_id": "category", "date": "datetime64[ns]"},
+            )
+        df = df.drop(columns=[col for col in df.columns[:1] if str(col).startswith("Unnamed")])
+        # int32 floor: narrower types silently wrap in element-wise arithmetic
+        demand = df["demand"]
+        if pd.api.types.is_integer_dtype(demand) and demand.dtype.itemsize > 4:
+            info = np.iinfo(np.int32)
+            if demand.empty or (demand.min() >= info.min and demand.max() <= info.max):
+                df["demand"] = demand.astype(np.int32)
+        return df
 
+    def _read_sidecar(self, file_path: str, source: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """The cached frame if the sidecar matches the CSV, else None."""
+        import pyarrow.parquet as pq
+
+        sidecar = self._sidecar_path(file_path)
+        if not os.path.exists(sidecar):
+            return None
+        metadata = pq.read_schema(sidecar).metadata or {}
+        cached = json.loads(metadata.get(self.SIDECAR_KEY, b"{}"))
+        if cached.get("version") != source["version"] or cached.get("size") != source["size"]:
+            return None
+        if cached.get("mtime_ns") != source["mtime_ns"]:
+            # touched: trust the sidecar only if the content is unchanged
+            source["sha256"] = self._file_hash(file_path)
+            if cached.get("sha256") != source["sha256"]:
+                return None
+            df = pq.read_table(sidecar).to_pandas()
+            self._write_sidecar(file_path, df, source)
+            return df
+        return pq.read_table(sidecar).to_pandas()
+
+    def _write_sidecar(self, file_path: str, df: pd.DataFrame, source: Dict[str, Any]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        source.setdefault("sha256", self._file_hash(file_path))
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[self.SIDECAR_KEY] = json.dumps(source).encode()
+        sidecar = self._sidecar_path(file_path)
+        tmp_path = f"{sidecar}.tmp"
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+        os.replace(tmp_path, sidecar)
 
     def load(self, file_path: str) -> pd.DataFrame:
         """
-        Load data from a CSV file; if file does not exist, simulate data and save.
+        Load demand data from a CSV file (local path or URL).
 
         Returns
         -------
         pd.DataFrame
-            A DataFrame with columns ['unique_id', 'date', 'demand'].
+            A DataFrame with columns ['unique_id', 'date', 'demand'] (plus any further
+            CSV columns); `unique_id` is categorical and integer `demand` at least int32.
         """
-        df = pd.read_csv(file_path, index_col=0, parse_dates=True).reset_index()
-        df["date"] = pd.to_datetime(df["date"])
-
-
+        if not (self.use_cache and os.path.isfile(file_path)):
+            return self._read_csv(file_path)
+
+        stat = os.stat(file_path)
+        source = {"version": self.SIDECAR_VERSION, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        try:
+            df = self._read_sidecar(file_path, source)
+        except (ImportError, OSError, ValueError):
+            df = None
+        if df is not None:
+            return df
+
+        df = self._read_csv(file_path)
+        try:
+            self._write_sidecar(file_path, df, source)
+        except (ImportError, OSError):
+            pass  # read-only location or no pyarrow: serve the parsed CSV uncached
         return df
 
 
@@ -160,3 +430,141 @@ class DataSplitter:
         train = df[df["date"] < self.cutoff_date].copy()
         test = df[df["date"] >= self.cutoff_date].copy()
         return train, test
+
+
+@dataclass
+class SplitWindow:
+    """
+    One rolling-origin window as positional row ranges into `RollingOriginSplitter.data_`.
+
+    Series s trains on rows [starts[s], train_stops[s]) and is tested on rows
+    [test_starts[s], test_stops[s]); empty ranges mean the series has no rows there.
+    `cutoff` is the cutoff date, or None for windows counted back from each series' end.
+    """
+    cutoff: Optional[pd.Timestamp]
+    starts: np.ndarray
+    train_stops: np.ndarray
+    test_starts: np.ndarray
+    test_stops: np.ndarray
+
+    @staticmethod
+    def _positions(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+        lengths = np.maximum(stops - starts, 0)
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return offsets + np.arange(lengths.sum())
+
+    def train_positions(self) -> np.ndarray:
+        """Row positions of all training rows, for `data_.take` when a panel frame is needed."""
+        return self._positions(self.starts, self.train_stops)
+
+    def test_positions(self) -> np.ndarray:
+        return self._positions(self.test_starts, self.test_stops)
+
+
+class RollingOriginSplitter:
+    """
+    Train / test windows for many cutoffs without copying the history per window.
+
+    `fit` sorts the frame once by (unique_id, date) (not at all if it already is) and
+    locates every cutoff in every series with a single binary search over combined
+    (series, date) keys. Windows are then only positional ranges into the sorted frame:
+    `windows` yields them as `SplitWindow`s and `iter_series` as per-series slice views.
+
+    Cutoffs are either dates (the training rows are those before the cutoff, or up to
+    and including it with `inclusive=True`) or StatsForecast-style `n_windows` /
+    `step_size` counted back from the end of each series. A series with no training
+    rows in a window (it starts after the cutoff, or is shorter than the windows reach
+    back) is dropped from that window: both its ranges are empty.
+    """
+
+    def __init__(
+        self,
+        cutoffs: Optional[Sequence] = None,
+        h: Optional[int] = None,
+        n_windows: Optional[int] = None,
+        step_size: Optional[int] = None,
+        inclusive: bool = False,
+        date_col: str = "date",
+        unique_id_col: str = "unique_id",
+    ):
+        """
+        Args:
+            cutoffs (sequence of dates, optional): Forecast origins.
+            h (int, optional): Test rows per series and window; all remaining rows if None
+                (required with n_windows).
+            n_windows (int, optional): Windows counted back from each series' end, used
+                when `cutoffs` is not given.
+            step_size (int, optional): Rows between those windows; defaults to `h`.
+            inclusive (bool): Whether the cutoff date itself belongs to the training rows.
+        """
+        if cutoffs is None and (n_windows is None or h is None):
+            raise ValueError("Provide either cutoffs or n_windows and h.")
+        self.cutoffs = None if cutoffs is None else pd.to_datetime(pd.Index(cutoffs)).sort_values()
+        self.h = h
+        self.n_windows = n_windows
+        self.step_size = step_size or h
+        self.inclusive = inclusive
+        self.date_col = date_col
+        self.unique_id_col = unique_id_col
+
+    def fit(self, df: pd.DataFrame) -> "RollingOriginSplitter":
+        """Sort `df` once and compute the row ranges of all windows."""
+        codes, uids = pd.factorize(df[self.unique_id_col], sort=True)
+        dates = pd.to_datetime(df[self.date_col]).values
+        order = np.lexsort((dates, codes))
+        if np.array_equal(order, np.arange(len(order))):
+            self.data_ = df
+        else:
+            self.data_ = df.take(order)
+            codes, dates = codes[order], dates[order]
+        self.uids_ = np.asarray(uids)
+
+        n_series = len(self.uids_)
+        bounds = np.searchsorted(codes, np.arange(n_series + 1))
+        self.starts_, ends = bounds[:-1], bounds[1:]
+
+        if self.cutoffs is not None:
+            # date ranks make (series, date) one sortable integer key
+            unique_dates = np.unique(dates)
+            width = len(unique_dates) + 1
+            keys = codes.astype(np.int64) * width + np.searchsorted(unique_dates, dates)
+            side = "right" if self.inclusive else "left"
+            ranks = np.searchsorted(unique_dates, self.cutoffs.values, side=side)
+            targets = np.arange(n_series, dtype=np.int64)[None, :] * width + ranks[:, None]
+            self.train_stops_ = np.searchsorted(keys, targets)
+            self.test_starts_ = self.train_stops_
+        else:
+            offsets = self.step_size * np.arange(self.n_windows - 1, -1, -1)
+            raw = ends[None, :] - self.h - offsets[:, None]
+            self.train_stops_ = np.maximum(raw, self.starts_[None, :])
+            self.test_starts_ = self.train_stops_
+
+        self.test_stops_ = np.broadcast_to(ends, self.train_stops_.shape)
+        if self.h is not None:
+            self.test_stops_ = np.minimum(self.test_starts_ + self.h, self.test_stops_)
+        # a series without training rows in a window cannot be forecast there: drop the pair
+        no_train = self.train_stops_ <= self.starts_[None, :]
+        self.test_stops_ = np.where(no_train, self.test_starts_, self.test_stops_)
+        return self
+
+    def windows(self) -> Iterator[SplitWindow]:
+        """Yield the windows in cutoff order as positional ranges."""
+        for w in range(len(self.train_stops_)):
+            yield SplitWindow(
+                cutoff=None if self.cutoffs is None else self.cutoffs[w],
+                starts=self.starts_,
+                train_stops=self.train_stops_[w],
+                test_starts=self.test_starts_[w],
+                test_stops=self.test_stops_[w],
+            )
+
+    def iter_series(self) -> Iterator[Tuple[Any, Any, pd.DataFrame, pd.DataFrame]]:
+        """Yield (unique_id, cutoff, train, test) per window and series as slice views of `data_`."""
+        for window in self.windows():
+            for s, uid in enumerate(self.uids_):
+                yield (
+                    uid,
+                    window.cutoff,
+                    self.data_.iloc[window.starts[s]:window.train_stops[s]],
+                    self.data_.iloc[window.test_starts[s]:window.test_stops[s]],
+                )
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Sequence
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets selection of `n_out` points of a line.
+
+    The first and last points are always kept. The remaining points are split into
+    `n_out - 2` equal buckets, and from each bucket the point forming the largest
+    triangle with the previously selected point and the mean of the next bucket is kept.
+
+    Parameters
+    ----------
+    x, y : np.ndarray
+        Coordinates of the line, sorted by `x`.
+    n_out : int
+        Number of points to keep.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted positional indices of the selected points.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # bucket i covers [edges[i], edges[i + 1]); the last bucket is the final point
+    edges = (np.floor(np.arange(n_out - 1) * (n - 2) / (n_out - 2)) + 1).astype(int)
+    edges = np.r_[edges, n]
+    # mean of every bucket, used as the third triangle corner for the bucket before it
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[1:], edges[:-1] - 1) / counts
+    mean_y = np.add.reduceat(y[1:], edges[:-1] - 1) / counts
+
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        xs, ys = x[start:end], y[start:end]
+        area = np.abs((x[a] - mean_x[i + 1]) * (ys - y[a]) - (x[a] - xs) * (mean_y[i + 1] - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample(
+    df: pd.DataFrame,
+    x_col: str,
+    y_cols: Sequence[str],
+    max_points: Optional[int],
+    keep: Optional[Sequence] = None,
+) -> pd.DataFrame:
+    """
+    Reduce a frame to roughly `max_points` rows per y column for plotting.
+
+    Rows are selected with LTTB on every y column; the union of the selections is
+    returned, together with the minimum and maximum of every y column and the rows
+    at and right before every x value in `keep` (e.g. cutoff dates), so extremes and
+    boundaries stay exact.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Frame with one row per x value.
+    x_col : str
+        Column with the x values (dates or numbers).
+    y_cols : sequence of str
+        Columns drawn as lines.
+    max_points : int, optional
+        Point budget per y column; the frame is returned unchanged if None or not exceeded.
+    keep : sequence, optional
+        x values whose rows (and direct predecessors) must be kept.
+
+    Returns
+    -------
+    pd.DataFrame
+        The selected rows in x order.
+    """
+    if max_points is None or len(df) <= max_points:
+        return df
+
+    df = df.sort_values(x_col, kind="mergesort")
+    x_values = df[x_col]
+    if pd.api.types.is_datetime64_any_dtype(x_values):
+        x_values = pd.to_datetime(x_values)
+        x = x_values.values.astype("datetime64[ns]").astype(np.int64).astype(float)
+    else:
+        x = x_values.values.astype(float)
+
+    parts: List[np.ndarray] = []
+    for col in y_cols:
+        y = df[col].values.astype(float)
+        valid = np.flatnonzero(~np.isnan(y))
+        if len(valid) == 0:
+            continue
+        parts.append(valid[lttb_indices(x[valid], y[valid], max_points)])
+        parts.append(valid[[np.argmin(y[valid]), np.argmax(y[valid])]])
+
+    if keep is not None and len(keep):
+        keep_values = pd.Index(keep)
+        if pd.api.types.is_datetime64_any_dtype(x_values):
+            keep_values = pd.to_datetime(keep_values).values.astype("datetime64[ns]").astype(np.int64)
+        positions = np.searchsorted(x, np.asarray(keep_values, dtype=float))
+        parts.append(np.clip(np.r_[positions - 1, positions], 0, len(df) - 1))
+
+    if not parts:
+        return df
+    rows = np.unique(np.concatenate(parts))
+    return df.iloc[rows]
+
+
+class SharedDataChart:
+    """
+    Layered Altair chart whose layers all read one top-level dataset.
+
+    The frame is serialized once (Altair stores it under `datasets` and refers to it
+    by name), and every layer is a view on it derived with transforms, e.g. `fold` to
+    turn component columns into a long (Component, Value) table inside Vega-Lite
+    instead of attaching a melted copy per layer.
+    """
+
+    def __init__(self, data: pd.DataFrame, columns: Optional[Sequence[str]] = None):
+        # only ship the columns the layers use
+        self.data = data[list(columns)] if columns is not None else data
+        self.layers: List["alt.Chart"] = []
+
+    @staticmethod
+    def base() -> "alt.Chart":
+        """An empty chart that inherits the shared dataset."""
+        import altair as alt
+
+        return alt.Chart()
+
+    @staticmethod
+    def fold(columns: Sequence[str], as_: Sequence[str] = ("Component", "Value")) -> "alt.Chart":
+        """Long view of `columns` as (name, value) rows, dropping missing values."""
+        import altair as alt
+
+        return (
+            alt.Chart()
+            .transform_fold(list(columns), as_=list(as_))
+            .transform_filter(f"isValid(datum['{as_[1]}'])")
+        )
+
+    @staticmethod
+    def distinct(column: str, where: Optional[str] = None) -> "alt.Chart":
+        """One row per distinct value of `column` (optionally among rows matching `where`)."""
+        import altair as alt
+
+        chart = alt.Chart()
+        if where is not None:
+            chart = chart.transform_filter(where)
+        return chart.transform_aggregate(groupby=[column])
+
+    def add(self, *layers: "alt.Chart") -> "SharedDataChart":
+        self.layers.extend(layers)
+        return self
+
+    def build(self) -> "alt.LayerChart":
+        import altair as alt
+
+        return alt.layer(*self.layers, data=self.data)